@@ -1,11 +1,26 @@
 from __future__ import annotations
 
+import copy
+import json
 import dataclasses
+import functools
+import sys
 import typing
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 import logging
-from typing import Any, Callable, Dict, List, Optional, Text, Type, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Text,
+    Type,
+    Tuple,
+)
 
 
 from rasa.engine.exceptions import (
@@ -22,6 +37,39 @@ if typing.TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _add_slots(cls: Type) -> Type:
+    """Recreates a dataclass with `__slots__` for its fields.
+
+    Schemas can contain hundreds of nodes, so dropping the per-instance
+    `__dict__` saves memory and speeds up attribute access. This is the
+    standard recipe for slotted dataclasses on Python versions before 3.10
+    (where `@dataclass(slots=True)` became available).
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in dataclasses.fields(cls))
+    cls_dict["__slots__"] = field_names
+    for field_name in field_names:
+        # Remove defaults stored as class attributes as they would clash with
+        # the slot descriptors. The generated `__init__` keeps its own copy.
+        cls_dict.pop(field_name, None)
+    cls_dict.pop("__dict__", None)
+
+    qualname = getattr(cls, "__qualname__", None)
+    cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    if qualname is not None:
+        cls.__qualname__ = qualname
+
+    return cls
+
+
+# Schemas reference the same component classes over and over again. Caching the
+# resolution avoids going through the import machinery for every node.
+_class_from_module_path = functools.lru_cache(maxsize=None)(
+    rasa.shared.utils.common.class_from_module_path
+)
+
+
+@_add_slots
 @dataclass
 class SchemaNode:
     """Represents one node in the schema."""
@@ -37,28 +85,77 @@ class SchemaNode:
     resource: Optional[Resource] = None
 
 
+_SCHEMA_NODE_FIELDS = tuple(
+    schema_field.name for schema_field in dataclasses.fields(SchemaNode)
+)
+
+
+def _node_as_serializable_dict(node: SchemaNode) -> Dict[Text, Any]:
+    # `dataclasses.asdict` would deep-copy every field. The fields only
+    # contain plain JSON-safe types, so we build the dict directly.
+    serializable = {
+        field_name: getattr(node, field_name) for field_name in _SCHEMA_NODE_FIELDS
+    }
+
+    # Classes are not JSON serializable (surprise)
+    serializable["uses"] = f"{node.uses.__module__}.{node.uses.__name__}"
+    if node.resource:
+        serializable["resource"] = dataclasses.asdict(node.resource)
+
+    return serializable
+
+
+def schema_json_default(value: Any) -> Any:
+    """`json.dumps` default hook which serializes schemas and their nodes."""
+    if isinstance(value, GraphSchema):
+        return value.nodes
+    if isinstance(value, SchemaNode):
+        return _node_as_serializable_dict(value)
+
+    raise TypeError(
+        f"Object of type {type(value).__name__} is not JSON serializable."
+    )
+
+
 @dataclass
 class GraphSchema:
     """Represents a graph for training a model or making predictions."""
 
     nodes: Dict[Text, SchemaNode]
 
+    def __post_init__(self) -> None:
+        """Initializes the lazily computed target name and ancestor caches."""
+        self._cached_target_names: Optional[List[Text]] = None
+        self._ancestor_cache: Dict[Text, FrozenSet[Text]] = {}
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> GraphSchema:
+        """Deep-copies the nodes but not the target name cache.
+
+        Copies are typically made to mutate them (e.g. the trainer marks every
+        node as a target for fingerprint runs), so the copy must recompute its
+        targets on first access.
+        """
+        return GraphSchema(copy.deepcopy(self.nodes, memo))
+
     def as_dict(self) -> Dict[Text, Any]:
         """Returns graph schema in a serializable format.
 
         Returns:
             The graph schema in a format which can be dumped as JSON or other formats.
         """
-        serializable_graph_schema = {}
-        for node_name, node in self.nodes.items():
-            serializable = dataclasses.asdict(node)
-
-            # Classes are not JSON serializable (surprise)
-            serializable["uses"] = f"{node.uses.__module__}.{node.uses.__name__}"
+        return {
+            node_name: _node_as_serializable_dict(node)
+            for node_name, node in self.nodes.items()
+        }
 
-            serializable_graph_schema[node_name] = serializable
+    def to_json(self) -> Text:
+        """Serializes the schema directly to JSON.
 
-        return serializable_graph_schema
+        Unlike `json.dumps(schema.as_dict())` this converts each node while the
+        serializer walks the schema instead of building the full intermediate
+        dict up front.
+        """
+        return json.dumps(self, default=schema_json_default)
 
     @classmethod
     def from_dict(cls, serialized_graph_schema: Dict[Text, Any]) -> GraphSchema:
@@ -75,11 +172,24 @@ class GraphSchema:
                 found.
         """
         nodes = {}
+        # Many nodes share identical (often empty) `config` and `needs` dicts.
+        # Re-using the first-seen instance instead of keeping one dict per node
+        # shrinks large deserialized schemas. Safe because schema mutations
+        # (e.g. during pruning) reassign these fields rather than mutating the
+        # dicts in place.
+        seen_dicts: Dict[FrozenSet[Tuple[Text, Any]], Dict[Text, Any]] = {}
+
+        def _deduplicated(candidate: Dict[Text, Any]) -> Dict[Text, Any]:
+            try:
+                key = frozenset(candidate.items())
+            except TypeError:
+                # Unhashable config values - keep the node's own dict.
+                return candidate
+            return seen_dicts.setdefault(key, candidate)
+
         for node_name, serialized_node in serialized_graph_schema.items():
             try:
-                serialized_node[
-                    "uses"
-                ] = rasa.shared.utils.common.class_from_module_path(
+                serialized_node["uses"] = _class_from_module_path(
                     serialized_node["uses"]
                 )
 
@@ -94,14 +204,32 @@ class GraphSchema:
                     f"'{serialized_node['uses']}'."
                 ) from e
 
-            nodes[node_name] = SchemaNode(**serialized_node)
+            # Node names and input keys are used as dict keys in tight lookup
+            # loops all over the graph code. Interning them makes those dict
+            # probes identity-based.
+            serialized_node["needs"] = _deduplicated(
+                {
+                    sys.intern(input_name): sys.intern(parent_name)
+                    for input_name, parent_name in serialized_node["needs"].items()
+                }
+            )
+            serialized_node["config"] = _deduplicated(serialized_node["config"])
+            nodes[sys.intern(node_name)] = SchemaNode(**serialized_node)
 
         return GraphSchema(nodes)
 
     @property
     def target_names(self) -> List[Text]:
-        """Returns the names of all target nodes."""
-        return [node_name for node_name, node in self.nodes.items() if node.is_target]
+        """Returns the names of all target nodes.
+
+        The result is computed once and cached; the schema is expected not to
+        change targets after the first access.
+        """
+        if self._cached_target_names is None:
+            self._cached_target_names = [
+                node_name for node_name, node in self.nodes.items() if node.is_target
+            ]
+        return self._cached_target_names
 
     def minimal_graph_schema(self) -> GraphSchema:
         """Returns a new schema where all nodes are a descendant of a target."""
@@ -115,16 +243,80 @@ class GraphSchema:
             }
         )
 
-    def _all_dependencies_schema(self, targets: List[Text]) -> List[Text]:
-        required = []
+    def topological_order(self) -> Tuple[Text, ...]:
+        """Returns the node names in topological order.
+
+        Each node appears after all of the nodes it `needs` (Kahn's algorithm,
+        O(V+E)).
+
+        Raises:
+            GraphSchemaException: In case the graph contains a cycle.
+        """
+        in_degree = {
+            node_name: len(node.needs) for node_name, node in self.nodes.items()
+        }
+        dependents: Dict[Text, List[Text]] = {node_name: [] for node_name in self.nodes}
+        for node_name, node in self.nodes.items():
+            for parent_name in node.needs.values():
+                dependents[parent_name].append(node_name)
+
+        ready = [node_name for node_name, degree in in_degree.items() if degree == 0]
+        order = []
+        while ready:
+            node_name = ready.pop()
+            order.append(node_name)
+            for dependent in dependents[node_name]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(order) != len(self.nodes):
+            raise GraphSchemaException(
+                "Graph schema contains a cycle and cannot be ordered."
+            )
+
+        return tuple(order)
+
+    def _all_dependencies_schema(self, targets: List[Text]) -> Set[Text]:
+        required: Set[Text] = set()
         for target in targets:
-            required.append(target)
-            target_dependencies = self.nodes[target].needs.values()
-            for dependency in target_dependencies:
-                required += self._all_dependencies_schema([dependency])
+            required |= self._ancestors_of(target)
 
         return required
 
+    def _ancestors_of(self, node_name: Text) -> FrozenSet[Text]:
+        """Returns the node and all nodes it (transitively) `needs`.
+
+        The per-node sets are cached across calls, so each node's ancestors
+        are computed once ever. Like the caches above this assumes the schema
+        is not mutated after first access; copies made via `copy.deepcopy`
+        start with fresh caches.
+        """
+        cache = self._ancestor_cache
+        cached = cache.get(node_name)
+        if cached is not None:
+            return cached
+
+        # Iterative post-order traversal: a node's ancestor set is built after
+        # the sets of all its parents are in the cache.
+        stack = [(node_name, False)]
+        while stack:
+            current, parents_done = stack.pop()
+            if current in cache:
+                continue
+            if parents_done:
+                ancestors = {current}
+                for parent in self.nodes[current].needs.values():
+                    ancestors |= cache[parent]
+                cache[current] = frozenset(ancestors)
+            else:
+                stack.append((current, True))
+                for parent in self.nodes[current].needs.values():
+                    if parent not in cache:
+                        stack.append((parent, False))
+
+        return cache[node_name]
+
 
 class GraphComponent(ABC):
     """Interface for any component which will run in a graph."""
@@ -252,6 +444,7 @@ class GraphNodeHook(ABC):
         ...
 
 
+@_add_slots
 @dataclass
 class ExecutionContext:
     """Holds information about a single graph run."""
@@ -262,6 +455,21 @@ class ExecutionContext:
     is_finetuning: bool = False
 
 
+# `get_default_config` returns a fresh dict on every call. The defaults are
+# static per component class, so cache them instead of rebuilding the dict for
+# every `GraphNode` instantiation.
+_default_config_cache: Dict[Type[GraphComponent], Dict[Text, Any]] = {}
+
+
+def _default_config_of(component_class: Type[GraphComponent]) -> Dict[Text, Any]:
+    try:
+        return _default_config_cache[component_class]
+    except KeyError:
+        default_config = component_class.get_default_config()
+        _default_config_cache[component_class] = default_config
+        return default_config
+
+
 class GraphNode:
     """Instantiates and runs a `GraphComponent` within a graph.
 
@@ -304,19 +512,29 @@ class GraphNode:
             execution_context: Information about the current graph run.
             hooks: These are called before and after execution.
         """
-        self._node_name: Text = node_name
+        self._node_name: Text = sys.intern(node_name)
         self._component_class: Type[GraphComponent] = component_class
         self._constructor_name: Text = constructor_name
         self._constructor_fn: Callable = getattr(
             self._component_class, self._constructor_name
         )
+        self._constructor_param_names = frozenset(
+            rasa.shared.utils.common.arguments_of(self._constructor_fn)
+        )
         self._component_config: Dict[Text, Any] = {
-            **self._component_class.get_default_config(),
+            **_default_config_of(self._component_class),
             **component_config,
         }
         self._fn_name: Text = fn_name
         self._fn: Callable = getattr(self._component_class, self._fn_name)
-        self._inputs: Dict[Text, Text] = inputs
+        self._inputs: Dict[Text, Text] = {
+            sys.intern(input_name): sys.intern(parent_name)
+            for input_name, parent_name in inputs.items()
+        }
+        self._input_items: Tuple[Tuple[Text, Text], ...] = tuple(
+            self._inputs.items()
+        )
+        self._parent_node_names: Tuple[Text, ...] = tuple(self._inputs.values())
         self._eager: bool = eager
 
         self._model_storage = model_storage
@@ -337,7 +555,7 @@ class GraphNode:
             f"with config: {self._component_config}, and kwargs: {kwargs}."
         )
 
-        constructor = getattr(self._component_class, self._constructor_name)
+        constructor = self._constructor_fn
         try:
             self._component: GraphComponent = constructor(  # type: ignore[no-redef]
                 config=self._component_config,
@@ -366,9 +584,9 @@ class GraphNode:
         # The component gets a chance to persist itself
         return Resource(self._node_name)
 
-    def parent_node_names(self) -> List[Text]:
+    def parent_node_names(self) -> Tuple[Text, ...]:
         """The names of the parent nodes of this node."""
-        return list(self._inputs.values())
+        return self._parent_node_names
 
     def __call__(
         self, *inputs_from_previous_nodes: Tuple[Text, Any]
@@ -384,20 +602,22 @@ class GraphNode:
         """
         received_inputs: Dict[Text, Any] = dict(inputs_from_previous_nodes)
 
-        kwargs = {}
-        for input_name, input_node in self._inputs.items():
-            kwargs[input_name] = received_inputs[input_node]
+        kwargs = {
+            input_name: received_inputs[input_node]
+            for input_name, input_node in self._input_items
+        }
 
-        input_hook_outputs = self._run_before_hooks(kwargs)
+        input_hook_outputs = self._run_before_hooks(kwargs) if self._hooks else []
 
         if not self._eager:
-            constructor_kwargs = rasa.shared.utils.common.minimal_kwargs(
-                kwargs, self._constructor_fn
-            )
+            constructor_kwargs = {}
+            run_kwargs = {}
+            for key, value in kwargs.items():
+                if key in self._constructor_param_names:
+                    constructor_kwargs[key] = value
+                else:
+                    run_kwargs[key] = value
             self._load_component(**constructor_kwargs)
-            run_kwargs = {
-                k: v for k, v in kwargs.items() if k not in constructor_kwargs
-            }
         else:
             run_kwargs = kwargs
 
@@ -414,7 +634,8 @@ class GraphNode:
                 f"Error running graph component for node {self._node_name}."
             ) from e
 
-        self._run_after_hooks(input_hook_outputs, output)
+        if self._hooks:
+            self._run_after_hooks(input_hook_outputs, output)
 
         return self._node_name, output
 
@@ -158,8 +158,8 @@ class LocalModelStorage(ModelStorage):
     @staticmethod
     def _persist_metadata(metadata: ModelMetadata, temporary_directory: Path,) -> None:
 
-        rasa.shared.utils.io.dump_obj_as_json_to_file(
-            temporary_directory / MODEL_ARCHIVE_METADATA_FILE, metadata.as_dict()
+        rasa.shared.utils.io.write_text_file(
+            metadata.to_json(), temporary_directory / MODEL_ARCHIVE_METADATA_FILE
         )
 
     @staticmethod
@@ -1,5 +1,6 @@
 from __future__ import annotations
 import abc
+import json
 import logging
 from contextlib import contextmanager
 from dataclasses import dataclass
@@ -9,7 +10,7 @@ from typing import Tuple, Union, Text, ContextManager, Dict, Any
 
 from rasa.engine.storage.resource import Resource
 from rasa.shared.core.domain import Domain
-from rasa.engine.graph import GraphSchema
+from rasa.engine.graph import GraphSchema, schema_json_default
 
 
 logger = logging.getLogger(__name__)
@@ -119,6 +120,25 @@ class ModelMetadata:
             "predict_schema": self.predict_schema.as_dict(),
         }
 
+    def to_json(self) -> Text:
+        """Serializes the metadata directly to JSON.
+
+        The graph schemas are converted node by node while the serializer
+        walks them (see `GraphSchema.to_json`) instead of being materialized
+        via `as_dict` first. The output parses to the same dict as `as_dict`.
+        """
+        serializable = {
+            "domain": self.domain.as_dict(),
+            "trained_at": self.trained_at.isoformat(),
+            "model_id": self.model_id,
+            "rasa_open_source_version": self.rasa_open_source_version,
+            "train_schema": self.train_schema,
+            "predict_schema": self.predict_schema,
+        }
+        return json.dumps(
+            serializable, ensure_ascii=False, indent=2, default=schema_json_default
+        )
+
     @classmethod
     def from_dict(cls, serialized: Dict[Text, Any]) -> ModelMetadata:
         """Loads `ModelMetadata` which has been serialized using `metadata.as_dict()`.
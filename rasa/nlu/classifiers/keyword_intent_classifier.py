@@ -1,7 +1,7 @@
 import os
 import logging
 import re
-from typing import Any, Dict, Optional, Text
+from typing import Any, Dict, Optional, Pattern, Text
 
 from rasa.shared.constants import DOCS_URL_COMPONENTS
 from rasa.nlu import utils
@@ -15,6 +15,30 @@ from rasa.nlu.model import Metadata
 
 logger = logging.getLogger(__name__)
 
+# Below this many keywords a lowercased substring scan beats the regex engine
+# with `re.IGNORECASE` (which lowercases characters inside the matching loop).
+MAX_KEYWORDS_FOR_SUBSTRING_SEARCH = 16
+
+
+def _is_word_char(character: Text) -> bool:
+    return character.isalnum() or character == "_"
+
+
+def _is_whole_word_match(text: Text, start: int, end: int) -> bool:
+    """Checks the `[start, end)` occurrence sits on `\\b` boundaries.
+
+    Like the regex `\\b`, a boundary exists exactly where word-ness changes:
+    for a keyword edged by a word character the neighbouring character must
+    not be one (start and end of the text count as non-word), while a keyword
+    edged by a non-word character needs a word character next to it.
+    """
+    before_is_word = start > 0 and _is_word_char(text[start - 1])
+    after_is_word = end < len(text) and _is_word_char(text[end])
+    return (
+        _is_word_char(text[start]) is not before_is_word
+        and _is_word_char(text[end - 1]) is not after_is_word
+    )
+
 
 class KeywordIntentClassifier(IntentClassifier):
     """Intent classifier using simple keyword matching.
@@ -37,6 +61,58 @@ class KeywordIntentClassifier(IntentClassifier):
 
         self.case_sensitive = self.component_config.get("case_sensitive")
         self.intent_keyword_map = intent_keyword_map or {}
+        self._compile_keyword_patterns()
+
+    def _compile_keyword_patterns(self) -> None:
+        """Compiles all keywords into a single alternation pattern.
+
+        One pattern means one pass over the message text instead of one search
+        per keyword. Longer keywords come first in the alternation so the most
+        specific keyword wins at a given position.
+        """
+        re_flag = 0 if self.case_sensitive else re.IGNORECASE
+
+        if self.intent_keyword_map:
+            sorted_keywords = sorted(self.intent_keyword_map, key=len, reverse=True)
+            self._keyword_pattern: Optional[Pattern] = re.compile(
+                r"\b(" + "|".join(re.escape(k) for k in sorted_keywords) + r")\b",
+                flags=re_flag,
+            )
+        else:
+            self._keyword_pattern = None
+
+        self._intents_by_matched_keyword = {
+            keyword if self.case_sensitive else keyword.lower(): intent
+            for keyword, intent in self.intent_keyword_map.items()
+        }
+
+        # For small case-insensitive maps a plain substring scan on lowercased
+        # text is faster than the regex engine, see `_search_lowered_keywords`.
+        self._use_substring_search = (
+            not self.case_sensitive
+            and len(self.intent_keyword_map) <= MAX_KEYWORDS_FOR_SUBSTRING_SEARCH
+        )
+        self._lowered_keywords = sorted(
+            self._intents_by_matched_keyword, key=len, reverse=True
+        )
+
+    def _search_lowered_keywords(self, text: Text) -> Optional[Text]:
+        text = text.lower()
+        best_keyword = None
+        best_index = len(text)
+        # `_keyword_pattern` returns the leftmost match, with the longest
+        # keyword winning at that position. Mirror that here: track the
+        # earliest whole-word occurrence over all keywords, and let the
+        # longest-first iteration order decide ties at the same position.
+        for keyword in self._lowered_keywords:
+            index = text.find(keyword)
+            while -1 < index < best_index:
+                if _is_whole_word_match(text, index, index + len(keyword)):
+                    best_keyword = keyword
+                    best_index = index
+                    break
+                index = text.find(keyword, index + 1)
+        return best_keyword
 
     def train(
         self,
@@ -52,46 +128,83 @@ class KeywordIntentClassifier(IntentClassifier):
                 and ex.get(INTENT) != self.intent_keyword_map[ex.get(TEXT)]
             ):
                 duplicate_examples.add(ex.get(TEXT))
-                rasa.shared.utils.io.raise_warning(
-                    f"Keyword '{ex.get(TEXT)}' is a keyword to trigger intent "
-                    f"'{self.intent_keyword_map[ex.get(TEXT)]}' and also "
-                    f"intent '{ex.get(INTENT)}', it will be removed "
-                    f"from the list of keywords for both of them. "
-                    f"Remove (one of) the duplicates from the training data.",
-                    docs=DOCS_URL_COMPONENTS + "#keyword-intent-classifier",
-                )
             else:
                 self.intent_keyword_map[ex.get(TEXT)] = ex.get(INTENT)
-        for keyword in duplicate_examples:
-            self.intent_keyword_map.pop(keyword)
-            logger.debug(
-                f"Removed '{keyword}' from the list of keywords because it was "
-                "a keyword for more than one intent."
+
+        if duplicate_examples:
+            keyword_list = ", ".join(
+                f"'{keyword}'" for keyword in sorted(duplicate_examples)
             )
+            rasa.shared.utils.io.raise_warning(
+                f"The following keywords are assigned to more than one intent "
+                f"and will be removed from the list of keywords for all of "
+                f"them: {keyword_list}. "
+                f"Remove (one of) the duplicates from the training data.",
+                docs=DOCS_URL_COMPONENTS + "#keyword-intent-classifier",
+            )
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            for keyword in duplicate_examples:
+                self.intent_keyword_map.pop(keyword)
+                if debug_enabled:
+                    logger.debug(
+                        f"Removed '{keyword}' from the list of keywords because it "
+                        "was a keyword for more than one intent."
+                    )
 
         self._validate_keyword_map()
+        self._compile_keyword_patterns()
 
     def _validate_keyword_map(self) -> None:
+        if not self.intent_keyword_map:
+            return
+
         re_flag = 0 if self.case_sensitive else re.IGNORECASE
 
-        ambiguous_mappings = []
-        for keyword1, intent1 in self.intent_keyword_map.items():
-            for keyword2, intent2 in self.intent_keyword_map.items():
+        # One zero-width alternation finds every keyword occurring inside
+        # another keyword in a single scan per keyword, instead of one regex
+        # search per keyword pair. The lookahead keeps matches from consuming
+        # text, and sorting by length makes a contained keyword win over the
+        # keyword matching itself at the same position.
+        sorted_keywords = sorted(self.intent_keyword_map, key=len)
+        contained_keyword_pattern = re.compile(
+            r"\b(?=("
+            + "|".join(re.escape(keyword) + r"\b" for keyword in sorted_keywords)
+            + r"))",
+            flags=re_flag,
+        )
+        keywords_by_match = {
+            keyword if self.case_sensitive else keyword.lower(): keyword
+            for keyword in self.intent_keyword_map
+        }
+
+        ambiguous_mappings = {}
+        warned_pairs = set()
+        for keyword2, intent2 in self.intent_keyword_map.items():
+            for match in contained_keyword_pattern.finditer(keyword2):
+                matched = match.group(1)
+                keyword1 = keywords_by_match[
+                    matched if self.case_sensitive else matched.lower()
+                ]
+                intent1 = self.intent_keyword_map[keyword1]
                 if (
-                    re.search(r"\b" + keyword1 + r"\b", keyword2, flags=re_flag)
-                    and intent1 != intent2
+                    keyword1 == keyword2
+                    or intent1 == intent2
+                    or (keyword1, keyword2) in warned_pairs
                 ):
-                    ambiguous_mappings.append((intent1, keyword1))
-                    rasa.shared.utils.io.raise_warning(
-                        f"Keyword '{keyword1}' is a keyword of intent '{intent1}', "
-                        f"but also a substring of '{keyword2}', which is a "
-                        f"keyword of intent '{intent2}."
-                        f" '{keyword1}' will be removed from the list of keywords.\n"
-                        f"Remove (one of) the conflicting keywords from the"
-                        f" training data.",
-                        docs=DOCS_URL_COMPONENTS + "#keyword-intent-classifier",
-                    )
-        for intent, keyword in ambiguous_mappings:
+                    continue
+
+                warned_pairs.add((keyword1, keyword2))
+                ambiguous_mappings[keyword1] = intent1
+                rasa.shared.utils.io.raise_warning(
+                    f"Keyword '{keyword1}' is a keyword of intent '{intent1}', "
+                    f"but also a substring of '{keyword2}', which is a "
+                    f"keyword of intent '{intent2}."
+                    f" '{keyword1}' will be removed from the list of keywords.\n"
+                    f"Remove (one of) the conflicting keywords from the"
+                    f" training data.",
+                    docs=DOCS_URL_COMPONENTS + "#keyword-intent-classifier",
+                )
+        for keyword, intent in ambiguous_mappings.items():
             self.intent_keyword_map.pop(keyword)
             logger.debug(
                 f"Removed keyword '{keyword}' from intent "
@@ -101,7 +214,11 @@ class KeywordIntentClassifier(IntentClassifier):
 
     def process(self, message: Message, **kwargs: Any) -> None:
         """Set the message intent and add it to the output is it exists."""
-        intent_name = self._map_keyword_to_intent(message.get(TEXT))
+        if self.intent_keyword_map:
+            intent_name = self._map_keyword_to_intent(message.get(TEXT))
+        else:
+            # Nothing to match against, skip the per-message matching work.
+            intent_name = None
 
         confidence = 0.0 if intent_name is None else 1.0
         intent = {"name": intent_name, "confidence": confidence}
@@ -110,17 +227,27 @@ class KeywordIntentClassifier(IntentClassifier):
             message.set(INTENT, intent, add_to_output=True)
 
     def _map_keyword_to_intent(self, text: Text) -> Optional[Text]:
-        re_flag = 0 if self.case_sensitive else re.IGNORECASE
+        if self._use_substring_search:
+            keyword = self._search_lowered_keywords(text)
+        else:
+            match = (
+                self._keyword_pattern.search(text) if self._keyword_pattern else None
+            )
+            keyword = match.group(1) if match else None
+            if keyword and not self.case_sensitive:
+                keyword = keyword.lower()
 
-        for keyword, intent in self.intent_keyword_map.items():
-            if re.search(r"\b" + keyword + r"\b", text, flags=re_flag):
+        if keyword is not None:
+            intent = self._intents_by_matched_keyword[keyword]
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
                     f"KeywordClassifier matched keyword '{keyword}' to"
                     f" intent '{intent}'."
                 )
-                return intent
+            return intent
 
-        logger.debug("KeywordClassifier did not find any keywords in the message.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("KeywordClassifier did not find any keywords in the message.")
         return None
 
     def persist(self, file_name: Text, model_dir: Text) -> Dict[Text, Any]:
@@ -1,8 +1,24 @@
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import itertools
 import logging
+import sys
+from types import ModuleType
 import typing
-from typing import Any, Dict, Hashable, List, Optional, Set, Text, Tuple, Type, Iterable
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Text,
+    Tuple,
+    Type,
+)
 
 import rasa.utils.train_utils
 from rasa.exceptions import MissingDependencyException
@@ -22,6 +38,84 @@ if typing.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Component-name sets used repeatedly by the validators below; kept as
+# module-level frozensets so they are not rebuilt on every validation call.
+_DIET_OR_CRF = frozenset({"DIETClassifier", "CRFEntityExtractor"})
+_REGEX_COMPONENTS = frozenset({"RegexFeaturizer", "RegexEntityExtractor"})
+
+
+@functools.lru_cache(maxsize=None)
+def _registry() -> ModuleType:
+    """Returns the component registry module.
+
+    The registry cannot be imported at module load time as that would create
+    an import cycle. Caching the module reference here avoids re-running the
+    import machinery on every call that needs it.
+    """
+    from rasa.nlu import registry
+
+    return registry
+
+
+@functools.lru_cache(maxsize=None)
+def _tokenizer_base_class() -> Type["Component"]:
+    """Returns the `Tokenizer` base class (imported lazily, see `_registry`)."""
+    from rasa.nlu.tokenizers.tokenizer import Tokenizer
+
+    return Tokenizer
+
+
+@functools.lru_cache(maxsize=None)
+def _metadata_class() -> Type["Metadata"]:
+    """Returns the `Metadata` class (imported lazily, see `_registry`)."""
+    from rasa.nlu.model import Metadata
+
+    return Metadata
+
+
+@functools.lru_cache(maxsize=None)
+def _component_class(component_name: Text) -> Type["Component"]:
+    """Resolves a component name to its class (cached per name).
+
+    The registry resolves custom component names via module-path lookups,
+    which is too slow to repeat for every component of every model load.
+    """
+    return _registry().get_component_class(component_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _required_components_of(
+    component_class: Type["Component"],
+) -> Tuple[Type["Component"], ...]:
+    """Returns the required components of a component class.
+
+    The result is a class-level invariant, so it is cached to avoid
+    re-allocating the list on every validation pass.
+    """
+    return tuple(component_class.required_components())
+
+
+@functools.lru_cache(maxsize=None)
+def _allowed_keys_of(component_class: Type["Component"]) -> FrozenSet[Text]:
+    """Returns the config keys a component class accepts (cached per class)."""
+    return frozenset(component_class.defaults.keys())
+
+
+@functools.lru_cache(maxsize=None)
+def _unavailable_packages_for(component_name: Text) -> Tuple[Text, ...]:
+    """Returns the missing required packages of a registered component.
+
+    The registry lookup and the import probing for each package are
+    comparatively expensive, and pipelines usually repeat component names
+    across validations, so the result is memoized per component name.
+    """
+    component_class = _component_class(component_name)
+    return tuple(
+        rasa.utils.common.find_unavailable_packages(
+            component_class.required_packages()
+        )
+    )
+
 
 def validate_requirements(component_names: List[Optional[Text]]) -> None:
     """Validates that all required importable python packages are installed.
@@ -35,24 +129,30 @@ def validate_requirements(component_names: List[Optional[Text]]) -> None:
     Args:
         component_names: The list of component names.
     """
-    from rasa.nlu import registry
+    if any(component_name is None for component_name in component_names):
+        raise InvalidConfigException(
+            "Your pipeline configuration contains a component that is missing "
+            "a name. Please double check your configuration or if this is a "
+            "custom component make sure to implement the name property for "
+            "the component."
+        )
 
-    # Validate that all required packages are installed
-    failed_imports = {}
-    for component_name in component_names:
-        if component_name is None:
-            raise InvalidConfigException(
-                "Your pipeline configuration contains a component that is missing "
-                "a name. Please double check your configuration or if this is a "
-                "custom component make sure to implement the name property for "
-                "the component."
-            )
-        component_class = registry.get_component_class(component_name)
-        unavailable_packages = rasa.utils.common.find_unavailable_packages(
-            component_class.required_packages()
+    if not component_names:
+        return
+
+    # Validate that all required packages are installed. Probing a package
+    # boils down to filesystem-bound `find_spec` calls, so the per-component
+    # probes are run concurrently.
+    with ThreadPoolExecutor(max_workers=min(8, len(component_names))) as executor:
+        unavailable = list(
+            executor.map(_unavailable_packages_for, component_names)
         )
-        if unavailable_packages:
-            failed_imports[component_name] = unavailable_packages
+
+    failed_imports = {
+        component_name: unavailable_packages
+        for component_name, unavailable_packages in zip(component_names, unavailable)
+        if unavailable_packages
+    }
     if failed_imports:  # pragma: no cover
         dependency_component_map = defaultdict(list)
         for component, missing_dependencies in failed_imports.items():
@@ -84,17 +184,16 @@ def validate_component_keys(
         component_config: The user-provided config for the component in the pipeline
     """
     component_name = component_config.get("name")
-    allowed_keys = set(component.defaults.keys())
-    provided_keys = set(component_config.keys())
-    provided_keys.discard("name")
-    list_separator = "\n- "
-    for key in provided_keys:
-        if key not in allowed_keys:
+    allowed_keys = _allowed_keys_of(type(component))
+    invalid_keys = component_config.keys() - allowed_keys - {"name"}
+    if invalid_keys:
+        valid_options = "\n- ".join(allowed_keys)
+        for key in invalid_keys:
             rasa.shared.utils.io.raise_warning(
                 f"You have provided an invalid key `{key}` "
                 f"for component `{component_name}` in your pipeline. "
                 f"Valid options for `{component_name}` are:\n- "
-                f"{list_separator.join(allowed_keys)}"
+                f"{valid_options}"
             )
 
 
@@ -112,6 +211,26 @@ def validate_empty_pipeline(pipeline: List["Component"]) -> None:
         )
 
 
+def _raise_multiple_tokenizers_error(tokenizer_names: List[Text]) -> None:
+    raise InvalidConfigException(
+        f"The pipeline configuration contains more than one tokenizer, "
+        f"which is not possible at this time. You can only use one tokenizer. "
+        f"The pipeline contains the following tokenizers: {tokenizer_names}. "
+    )
+
+
+def _raise_missing_components_error(
+    component_name: Text, missing_components: List[Text]
+) -> None:
+    missing_components_str = ", ".join(f"'{c}'" for c in missing_components)
+    raise InvalidConfigException(
+        f"The pipeline configuration contains errors. The component "
+        f"'{component_name}' requires {missing_components_str} to be "
+        f"placed before it in the pipeline. Please "
+        f"add the required components to the pipeline."
+    )
+
+
 def validate_only_one_tokenizer_is_used(pipeline: List["Component"]) -> None:
     """Validates that only one tokenizer is present in the pipeline.
 
@@ -119,38 +238,19 @@ def validate_only_one_tokenizer_is_used(pipeline: List["Component"]) -> None:
         pipeline: the list of the :class:`rasa.nlu.components.Component`.
     """
 
-    from rasa.nlu.tokenizers.tokenizer import Tokenizer
+    tokenizer_base = _tokenizer_base_class()
 
     tokenizer_names = []
     for component in pipeline:
-        if isinstance(component, Tokenizer):
+        if isinstance(component, tokenizer_base):
             tokenizer_names.append(component.name)
+            if len(tokenizer_names) > 1:
+                # Two tokenizers already violate the constraint, no need to
+                # keep scanning the rest of the pipeline.
+                break
 
     if len(tokenizer_names) > 1:
-        raise InvalidConfigException(
-            f"The pipeline configuration contains more than one tokenizer, "
-            f"which is not possible at this time. You can only use one tokenizer. "
-            f"The pipeline contains the following tokenizers: {tokenizer_names}. "
-        )
-
-
-def _required_component_in_pipeline(
-    required_component: Type["Component"], pipeline: List["Component"]
-) -> bool:
-    """Checks that required component present in the pipeline.
-
-    Args:
-        required_component: A class name of the required component.
-        pipeline: The list of the :class:`rasa.nlu.components.Component`.
-
-    Returns:
-        `True` if required_component is in the pipeline, `False` otherwise.
-    """
-
-    for previous_component in pipeline:
-        if isinstance(previous_component, required_component):
-            return True
-    return False
+        _raise_multiple_tokenizers_error(tokenizer_names)
 
 
 def validate_required_components(pipeline: List["Component"]) -> None:
@@ -159,35 +259,62 @@ def validate_required_components(pipeline: List["Component"]) -> None:
     Args:
         pipeline: The list of the :class:`rasa.nlu.components.Component`.
     """
+    # All classes the components seen so far are instances of. Checking a
+    # required component against this set replaces an `isinstance` scan over
+    # the pipeline prefix for every requirement.
+    preceding_types: Set[type] = set()
+    for component in pipeline:
 
-    for i, component in enumerate(pipeline):
-
-        missing_components = []
-        for required_component in component.required_components():
-            if not _required_component_in_pipeline(required_component, pipeline[:i]):
-                missing_components.append(required_component.name)
-
-        missing_components_str = ", ".join(f"'{c}'" for c in missing_components)
+        missing_components = [
+            required_component.name
+            for required_component in _required_components_of(type(component))
+            if required_component not in preceding_types
+        ]
 
         if missing_components:
-            raise InvalidConfigException(
-                f"The pipeline configuration contains errors. The component "
-                f"'{component.name}' requires {missing_components_str} to be "
-                f"placed before it in the pipeline. Please "
-                f"add the required components to the pipeline."
-            )
+            _raise_missing_components_error(component.name, missing_components)
+
+        preceding_types.update(type(component).__mro__)
 
 
 def validate_pipeline(pipeline: List["Component"]) -> None:
     """Validates the pipeline.
 
+    Collects the facts needed by all checks in a single pass over the
+    pipeline instead of one scan per check. Errors are reported in the same
+    order as the standalone validators: empty pipeline, then multiple
+    tokenizers, then missing required components.
+
     Args:
         pipeline: The list of the :class:`rasa.nlu.components.Component`.
     """
 
     validate_empty_pipeline(pipeline)
-    validate_only_one_tokenizer_is_used(pipeline)
-    validate_required_components(pipeline)
+
+    tokenizer_base = _tokenizer_base_class()
+    tokenizer_names = []
+    preceding_types: Set[type] = set()
+    first_missing: Optional[Tuple[Text, List[Text]]] = None
+    for component in pipeline:
+        if isinstance(component, tokenizer_base):
+            tokenizer_names.append(component.name)
+
+        if first_missing is None:
+            missing_components = [
+                required_component.name
+                for required_component in _required_components_of(type(component))
+                if required_component not in preceding_types
+            ]
+            if missing_components:
+                first_missing = (component.name, missing_components)
+            else:
+                preceding_types.update(type(component).__mro__)
+
+    if len(tokenizer_names) > 1:
+        _raise_multiple_tokenizers_error(tokenizer_names)
+
+    if first_missing is not None:
+        _raise_missing_components_error(*first_missing)
 
 
 def any_components_in_pipeline(
@@ -208,7 +335,7 @@ def any_components_in_pipeline(
 
 def find_components_in_pipeline(
     components: Iterable[Text], pipeline: List["Component"]
-) -> Set[Text]:
+) -> FrozenSet[Text]:
     """Finds those of the given components that are present in the pipeline.
 
     Args:
@@ -216,10 +343,9 @@ def find_components_in_pipeline(
         pipeline: A list of :class:`rasa.nlu.components.Component`s.
 
     Returns:
-        A list of str of component class names that are present in the pipeline.
+        The component class names that are present in the pipeline.
     """
-    pipeline_component_names = {c.name for c in pipeline}
-    return pipeline_component_names.intersection(components)
+    return frozenset(c.name for c in pipeline).intersection(components)
 
 
 def validate_required_components_from_data(
@@ -231,10 +357,30 @@ def validate_required_components_from_data(
         pipeline: The list of the :class:`rasa.nlu.components.Component`s.
         data: The :class:`rasa.shared.nlu.training_data.training_data.TrainingData`.
     """
-
-    if data.response_examples and not any_components_in_pipeline(
-        ["ResponseSelector"], pipeline
+    # Evaluate the (lazy) training data properties once; on the common path
+    # where most of them are empty the pipeline is never touched at all.
+    has_response_examples = bool(data.response_examples)
+    has_entity_examples = bool(data.entity_examples)
+    has_regex_features = bool(data.regex_features)
+    has_lookup_tables = bool(data.lookup_tables)
+    has_entity_synonyms = bool(data.entity_synonyms)
+
+    if not any(
+        [
+            has_response_examples,
+            has_entity_examples,
+            has_regex_features,
+            has_lookup_tables,
+            has_entity_synonyms,
+        ]
     ):
+        return
+
+    # Compute the component names once instead of re-walking the pipeline for
+    # every individual membership check below.
+    pipeline_names = frozenset(c.name for c in pipeline)
+
+    if has_response_examples and "ResponseSelector" not in pipeline_names:
         rasa.shared.utils.io.raise_warning(
             "You have defined training data with examples for training a response "
             "selector, but your NLU pipeline does not include a response selector "
@@ -242,9 +388,7 @@ def validate_required_components_from_data(
             "'ResponseSelector' to your pipeline."
         )
 
-    if data.entity_examples and not any_components_in_pipeline(
-        TRAINABLE_EXTRACTORS, pipeline
-    ):
+    if has_entity_examples and pipeline_names.isdisjoint(TRAINABLE_EXTRACTORS):
         rasa.shared.utils.io.raise_warning(
             "You have defined training data consisting of entity examples, but "
             "your NLU pipeline does not include an entity extractor trained on "
@@ -252,9 +396,7 @@ def validate_required_components_from_data(
             f"{TRAINABLE_EXTRACTORS} to your pipeline."
         )
 
-    if data.entity_examples and not any_components_in_pipeline(
-        {"DIETClassifier", "CRFEntityExtractor"}, pipeline
-    ):
+    if has_entity_examples and pipeline_names.isdisjoint(_DIET_OR_CRF):
         if data.entity_roles_groups_used():
             rasa.shared.utils.io.raise_warning(
                 "You have defined training data with entities that have roles/groups, "
@@ -264,9 +406,7 @@ def validate_required_components_from_data(
                 "pipeline."
             )
 
-    if data.regex_features and not any_components_in_pipeline(
-        ["RegexFeaturizer", "RegexEntityExtractor"], pipeline
-    ):
+    if has_regex_features and pipeline_names.isdisjoint(_REGEX_COMPONENTS):
         rasa.shared.utils.io.raise_warning(
             "You have defined training data with regexes, but "
             "your NLU pipeline does not include a 'RegexFeaturizer' or a "
@@ -274,9 +414,7 @@ def validate_required_components_from_data(
             "'RegexFeaturizer' or a 'RegexEntityExtractor' in your pipeline."
         )
 
-    if data.lookup_tables and not any_components_in_pipeline(
-        ["RegexFeaturizer", "RegexEntityExtractor"], pipeline
-    ):
+    if has_lookup_tables and pipeline_names.isdisjoint(_REGEX_COMPONENTS):
         rasa.shared.utils.io.raise_warning(
             "You have defined training data consisting of lookup tables, but "
             "your NLU pipeline does not include a 'RegexFeaturizer' or a "
@@ -284,25 +422,26 @@ def validate_required_components_from_data(
             "'RegexFeaturizer' or a 'RegexEntityExtractor' in your pipeline."
         )
 
-    if data.lookup_tables:
-        if not any_components_in_pipeline(
-            ["CRFEntityExtractor", "DIETClassifier"], pipeline
-        ):
+    if has_lookup_tables:
+        if pipeline_names.isdisjoint(_DIET_OR_CRF):
             rasa.shared.utils.io.raise_warning(
                 "You have defined training data consisting of lookup tables, but "
                 "your NLU pipeline does not include any components that use these "
                 "features. To make use of lookup tables, add a 'DIETClassifier' or a "
                 "'CRFEntityExtractor' with the 'pattern' feature to your pipeline."
             )
-        elif any_components_in_pipeline(["CRFEntityExtractor"], pipeline):
-            crf_components = [c for c in pipeline if c.name == "CRFEntityExtractor"]
+        elif "CRFEntityExtractor" in pipeline_names:
             # check to see if any of the possible CRFEntityExtractors will
-            # featurize `pattern`
-            has_pattern_feature = False
-            for crf in crf_components:
-                crf_features = crf.component_config.get("features")
-                # iterate through [[before],[word],[after]] features
-                has_pattern_feature = "pattern" in itertools.chain(*crf_features)
+            # featurize `pattern`; the features come as
+            # [[before], [word], [after]] lists which need to be flattened
+            has_pattern_feature = any(
+                feature == "pattern"
+                for crf in pipeline
+                if crf.name == "CRFEntityExtractor"
+                for feature in itertools.chain.from_iterable(
+                    crf.component_config.get("features") or ()
+                )
+            )
 
             if not has_pattern_feature:
                 rasa.shared.utils.io.raise_warning(
@@ -312,9 +451,7 @@ def validate_required_components_from_data(
                     "feature to the 'CRFEntityExtractor' in your pipeline."
                 )
 
-    if data.entity_synonyms and not any_components_in_pipeline(
-        ["EntitySynonymMapper"], pipeline
-    ):
+    if has_entity_synonyms and "EntitySynonymMapper" not in pipeline_names:
         rasa.shared.utils.io.raise_warning(
             "You have defined synonyms in your training data, but "
             "your NLU pipeline does not include an 'EntitySynonymMapper'. "
@@ -359,11 +496,10 @@ def warn_of_competition_with_regex_extractor(
         pipeline: The list of the :class:`rasa.nlu.components.Component`s.
         data: The :class:`rasa.shared.nlu.training_data.training_data.TrainingData`.
     """
-    present_general_extractors = find_components_in_pipeline(
-        TRAINABLE_EXTRACTORS, pipeline
-    )
+    pipeline_names = frozenset(c.name for c in pipeline)
+    present_general_extractors = pipeline_names.intersection(TRAINABLE_EXTRACTORS)
     has_general_extractors = len(present_general_extractors) > 0
-    has_regex_extractor = any_components_in_pipeline(["RegexEntityExtractor"], pipeline)
+    has_regex_extractor = "RegexEntityExtractor" in pipeline_names
 
     regex_entity_types = {rf["name"] for rf in data.regex_features}
     overlap_between_types = data.entities.intersection(regex_entity_types)
@@ -418,12 +554,22 @@ class UnsupportedLanguageError(RasaException):
 
 
 class ComponentMetaclass(type):
-    """Metaclass with `name` class property."""
+    """Metaclass that assigns every component class its `name` attribute."""
 
-    @property
-    def name(cls) -> Text:
-        """The name property is a function of the class - its __name__."""
-        return cls.__name__
+    def __init__(
+        cls, name: Text, bases: Tuple[type, ...], namespace: Dict[Text, Any]
+    ) -> None:
+        """Sets `name` as a plain class attribute.
+
+        The name of a component is a function of the class - its `__name__`.
+        A plain attribute instead of a metaclass property means `.name` reads
+        don't go through descriptor dispatch, which matters in the validators
+        that read it for every component of a pipeline.
+        """
+        super().__init__(name, bases, namespace)
+        # Interned so the repeated name-in-set checks during validation can
+        # compare by identity instead of hashing the string payload.
+        cls.name = sys.intern(name)
 
 
 class Component(metaclass=ComponentMetaclass):
@@ -448,17 +594,11 @@ class Component(metaclass=ComponentMetaclass):
     the pipeline to do intent classification.
     """
 
-    @property
-    def name(self) -> Text:
-        """Returns the name of the component to be used in the model configuration.
-
-        Component class name is used when integrating it in a
-        pipeline. E.g. `[ComponentA, ComponentB]`
-        will be a proper pipeline definition where `ComponentA`
-        is the name of the first component of the pipeline.
-        """
-        # cast due to https://github.com/python/mypy/issues/7945
-        return typing.cast(str, type(self).name)
+    # `name` is the class attribute set by `ComponentMetaclass`. It is the
+    # name of the component to be used in the model configuration, e.g.
+    # `[ComponentA, ComponentB]` will be a proper pipeline definition where
+    # `ComponentA` is the name of the first component of the pipeline.
+    name: Text
 
     @property
     def unique_name(self) -> Text:
@@ -697,7 +837,22 @@ class Component(metaclass=ComponentMetaclass):
         return d
 
     def __eq__(self, other: Any) -> bool:
-        return self.__dict__ == other.__dict__
+        """Compares components by identity first, then by configuration.
+
+        Comparing the full `__dict__` recursively compared arbitrarily large
+        attributes such as trained model state; the component type together
+        with its configuration identifies a component in a pipeline.
+        """
+        if self is other:
+            return True
+        return (
+            type(self) is type(other)
+            and self.component_config == other.component_config
+        )
+
+    # Defining `__eq__` would otherwise set `__hash__` to `None`; identity
+    # hashing keeps components usable in sets and as dict keys.
+    __hash__ = object.__hash__
 
     def prepare_partial_processing(
         self, pipeline: List["Component"], context: Dict[Text, Any]
@@ -809,40 +964,55 @@ class ComponentBuilder:
     Caches components for reuse.
     """
 
-    def __init__(self, use_cache: bool = True) -> None:
+    def __init__(self, use_cache: bool = True, max_cached: int = 32) -> None:
         self.use_cache = use_cache
+        self.max_cached = max_cached
         # Reuse nlp and featurizers where possible to save memory,
-        # every component that implements a cache-key will be cached
-        self.component_cache = {}
+        # every component that implements a cache-key will be cached.
+        # Bounded in LRU fashion so long-lived builders (e.g. in the server)
+        # don't retain every component ever loaded. Entries are keyed by
+        # `(component name, cache key)` so components of different classes
+        # can never collide on an overlapping cache key (e.g. a model name).
+        self.component_cache: "OrderedDict[Tuple[Text, Text], Component]" = (
+            OrderedDict()
+        )
 
     def __get_cached_component(
         self, component_meta: Dict[Text, Any], model_metadata: "Metadata"
-    ) -> Tuple[Optional[Component], Optional[Text]]:
+    ) -> Tuple[Optional[Component], Optional[Tuple[Text, Text]]]:
         """Load a component from the cache, if it exists.
 
-        Returns the component, if found, and the cache key.
+        Returns the component, if found, and its `(name, cache key)` entry.
         """
 
-        from rasa.nlu import registry
-
         # try to get class name first, else create by name
         component_name = component_meta.get("class", component_meta["name"])
-        component_class = registry.get_component_class(component_name)
+        component_class = _component_class(component_name)
         cache_key = component_class.cache_key(component_meta, model_metadata)
-        if (
-            cache_key is not None
-            and self.use_cache
-            and cache_key in self.component_cache
-        ):
+        if cache_key is None:
+            return None, None
+
+        cache_key = (component_name, sys.intern(cache_key))
+        if self.use_cache and cache_key in self.component_cache:
+            self.component_cache.move_to_end(cache_key)
             return self.component_cache[cache_key], cache_key
 
         return None, cache_key
 
-    def __add_to_cache(self, component: Component, cache_key: Optional[Text]) -> None:
+    def __add_to_cache(
+        self, component: Component, cache_key: Optional[Tuple[Text, Text]]
+    ) -> None:
         """Add a component to the cache."""
 
         if cache_key is not None and self.use_cache:
             self.component_cache[cache_key] = component
+            self.component_cache.move_to_end(cache_key)
+            while len(self.component_cache) > self.max_cached:
+                evicted_key, _ = self.component_cache.popitem(last=False)
+                logger.debug(
+                    f"Evicted component with key '{evicted_key}' from the "
+                    f"component cache."
+                )
             logger.info(
                 f"Added '{component.name}' to component cache. Key '{cache_key}'."
             )
@@ -870,13 +1040,11 @@ class ComponentBuilder:
         Returns:
             The loaded component.
         """
-        from rasa.nlu import registry
-
         try:
             cached_component, cache_key = self.__get_cached_component(
                 component_meta, model_metadata
             )
-            component = registry.load_component_by_meta(
+            component = _registry().load_component_by_meta(
                 component_meta, model_dir, model_metadata, cached_component, **context
             )
             if not cached_component:
@@ -905,15 +1073,14 @@ class ComponentBuilder:
         Returns:
             The created component.
         """
-        from rasa.nlu import registry
-        from rasa.nlu.model import Metadata
-
         try:
             component, cache_key = self.__get_cached_component(
-                component_config, Metadata(cfg.as_dict())
+                component_config, _metadata_class()(cfg.as_dict())
             )
             if component is None:
-                component = registry.create_component_by_config(component_config, cfg)
+                component = _registry().create_component_by_config(
+                    component_config, cfg
+                )
                 self.__add_to_cache(component, cache_key)
             return component
         except MissingArgumentError as e:  # pragma: no cover
@@ -3,7 +3,7 @@ import datetime
 import logging
 from math import ceil
 import os
-from typing import Any, Dict, List, Optional, Text
+from typing import Any, Dict, Iterator, List, Optional, Text
 
 import rasa.nlu
 from rasa.shared.exceptions import RasaException
@@ -479,6 +479,20 @@ class Interpreter:
         output.update(message.as_dict(only_output_properties=only_output_properties))
         return output
 
+    def parse_batch(
+        self, texts: List[Text], only_output_properties: bool = True
+    ) -> Iterator[Dict[Text, Any]]:
+        """Parses several input texts, yielding one pipeline result per text.
+
+        The default implementation parses lazily, one text at a time.
+        Interpreters backed by models which support batched inference can
+        override this to amortize the per-message overhead.
+        """
+        return (
+            self.parse(text, only_output_properties=only_output_properties)
+            for text in texts
+        )
+
     def featurize_message(self, message: Message) -> Message:
         """
         Tokenize and featurize the input message
@@ -1,3 +1,4 @@
+import asyncio
 import itertools
 import os
 import logging
@@ -753,19 +754,21 @@ def collect_incorrect_entity_predictions(
 
     Returns: list of incorrect predictions
     """
+    # compare all tokens at once instead of one Python comparison per token
+    mismatches = np.asarray(merged_targets) != np.asarray(merged_predictions)
+
     errors = []
     offset = 0
     for entity_result in entity_results:
-        for i in range(offset, offset + len(entity_result.tokens)):
-            if merged_targets[i] != merged_predictions[i]:
-                prediction: EntityPrediction = {
-                    "text": entity_result.message,
-                    "entities": entity_result.entity_targets,
-                    "predicted_entities": entity_result.entity_predictions,
-                }
-                errors.append(prediction)
-                break
-        offset += len(entity_result.tokens)
+        next_offset = offset + len(entity_result.tokens)
+        if mismatches[offset:next_offset].any():
+            prediction: EntityPrediction = {
+                "text": entity_result.message,
+                "entities": entity_result.entity_targets,
+                "predicted_entities": entity_result.entity_predictions,
+            }
+            errors.append(prediction)
+        offset = next_offset
     return errors
 
 
@@ -811,22 +814,24 @@ def collect_successful_entity_predictions(
 
     Returns: list of correct predictions
     """
+    # compare all tokens at once instead of one Python comparison per token
+    targets = np.asarray(merged_targets)
+    correct_entities = (targets == np.asarray(merged_predictions)) & (
+        targets != NO_ENTITY
+    )
+
     successes = []
     offset = 0
     for entity_result in entity_results:
-        for i in range(offset, offset + len(entity_result.tokens)):
-            if (
-                merged_targets[i] == merged_predictions[i]
-                and merged_targets[i] != NO_ENTITY
-            ):
-                prediction: EntityPrediction = {
-                    "text": entity_result.message,
-                    "entities": entity_result.entity_targets,
-                    "predicted_entities": entity_result.entity_predictions,
-                }
-                successes.append(prediction)
-                break
-        offset += len(entity_result.tokens)
+        next_offset = offset + len(entity_result.tokens)
+        if correct_entities[offset:next_offset].any():
+            prediction: EntityPrediction = {
+                "text": entity_result.message,
+                "entities": entity_result.entity_targets,
+                "predicted_entities": entity_result.entity_predictions,
+            }
+            successes.append(prediction)
+        offset = next_offset
     return successes
 
 
@@ -1246,17 +1251,18 @@ def get_eval_data(
 
     intent_results, entity_results, response_selection_results = [], [], []
 
-    response_labels = [
-        e.get(INTENT_RESPONSE_KEY)
-        for e in test_data.intent_examples
-        if e.get(INTENT_RESPONSE_KEY) is not None
-    ]
-    intent_labels = [e.get(INTENT) for e in test_data.intent_examples]
+    intent_labels, response_labels = set(), set()
+    for e in test_data.intent_examples:
+        intent_labels.add(e.get(INTENT))
+        intent_response_key = e.get(INTENT_RESPONSE_KEY)
+        if intent_response_key is not None:
+            response_labels.add(intent_response_key)
+
     should_eval_intents = (
-        is_intent_classifier_present(interpreter) and len(set(intent_labels)) >= 2
+        is_intent_classifier_present(interpreter) and len(intent_labels) >= 2
     )
     should_eval_response_selection = (
-        is_response_selector_present(interpreter) and len(set(response_labels)) >= 2
+        is_response_selector_present(interpreter) and len(response_labels) >= 2
     )
     available_response_selector_types = get_available_response_selector_types(
         interpreter
@@ -1266,9 +1272,19 @@ def get_eval_data(
         is_entity_extractor_present(interpreter) and len(test_data.entities) > 0
     )
 
-    for example in tqdm(test_data.nlu_examples):
-        result = interpreter.parse(example.get(TEXT), only_output_properties=False)
+    if not (
+        should_eval_intents or should_eval_response_selection or should_eval_entities
+    ):
+        # Nothing to evaluate - don't run the model over the test set at all.
+        return intent_results, response_selection_results, entity_results
 
+    results = interpreter.parse_batch(
+        [example.get(TEXT) for example in test_data.nlu_examples],
+        only_output_properties=False,
+    )
+    for example, result in zip(
+        test_data.nlu_examples, tqdm(results, total=len(test_data.nlu_examples))
+    ):
         if should_eval_intents:
             if fallback_classifier.is_fallback_classifier_prediction(result):
                 # Revert fallback prediction to not shadow
@@ -1864,13 +1880,13 @@ async def compare_nlu(
         train, test = data.train_test_split()
         rasa.shared.utils.io.write_text_file(test.nlu_as_markdown(), test_path)
 
-        for percentage in exclusion_percentages:
+        async def evaluate_percentage(
+            percentage: int,
+        ) -> Tuple[int, Dict[Text, float]]:
+            """Trains and evaluates every config on one exclusion percentage."""
             percent_string = f"{percentage}%_exclusion"
 
             _, train_included = train.train_test_split(percentage / 100)
-            # only count for the first run and ignore the others
-            if run == 0:
-                training_examples_per_run.append(len(train_included.nlu_examples))
 
             model_output_path = os.path.join(run_path, percent_string)
             train_split_path = os.path.join(model_output_path, "train")
@@ -1884,6 +1900,7 @@ async def compare_nlu(
                 train_included.nlg_as_markdown(), train_nlg_split_path
             )
 
+            f_scores = {}
             for nlu_config, model_name in zip(configs, model_names):
                 logger.info(
                     "Evaluating configuration '{}' with {} training data.".format(
@@ -1902,7 +1919,7 @@ async def compare_nlu(
                     # general exception catching needed to continue evaluating other
                     # model configurations
                     logger.warning(f"Training model '{model_name}' failed. Error: {e}")
-                    f_score_results[model_name][run].append(0.0)
+                    f_scores[model_name] = 0.0
                     continue
 
                 model_path = os.path.join(get_model(model_path), "nlu")
@@ -1912,8 +1929,23 @@ async def compare_nlu(
                     test_path, model_path, output_directory=output_path, errors=True
                 )
 
-                f1 = result["intent_evaluation"]["f1_score"]
-                f_score_results[model_name][run].append(f1)
+                f_scores[model_name] = result["intent_evaluation"]["f1_score"]
+
+            return len(train_included.nlu_examples), f_scores
+
+        # the percentages only share read-only inputs and write to separate
+        # directories, so they can be trained concurrently; `gather` keeps
+        # the results in percentage order
+        results = await asyncio.gather(
+            *(evaluate_percentage(percentage) for percentage in exclusion_percentages)
+        )
+
+        for number_of_examples, f_scores in results:
+            # only count for the first run and ignore the others
+            if run == 0:
+                training_examples_per_run.append(number_of_examples)
+            for model_name, f_score in f_scores.items():
+                f_score_results[model_name][run].append(f_score)
 
     return training_examples_per_run
 
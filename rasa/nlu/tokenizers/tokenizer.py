@@ -19,6 +19,10 @@ logger = logging.getLogger(__name__)
 
 
 class Token:
+    # Tokens are created for every word of every message, so avoiding a
+    # per-instance `__dict__` noticeably reduces memory on large datasets.
+    __slots__ = ("text", "start", "end", "data", "lemma")
+
     def __init__(
         self,
         text: Text,
@@ -25,7 +25,9 @@ PRETRAINED_EXTRACTORS = {
     "SpacyEntityExtractor",
     "DucklingHTTPExtractor",  # for backwards compatibility when dumping Markdown
 }
-TRAINABLE_EXTRACTORS = {"MitieEntityExtractor", "CRFEntityExtractor", "DIETClassifier"}
+TRAINABLE_EXTRACTORS = frozenset(
+    {"MitieEntityExtractor", "CRFEntityExtractor", "DIETClassifier"}
+)
 
 ENTITIES = "entities"
 ENTITY_TAGS = "entity_tags"
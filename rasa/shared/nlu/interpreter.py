@@ -105,15 +105,18 @@ class RegexInterpreter(NaturalLanguageInterpreter):
                 return True
         return False
 
+    # the regex matches "slot{"a": 1}"; compiled once as the allowed
+    # prefixes never change at runtime
+    _INTENT_AND_ENTITIES_PATTERN = re.compile(
+        "^[" + re.escape(INTENT_MESSAGE_PREFIX) + "]?([^{@]+)(@[0-9.]+)?([{].+)?"
+    )
+
     @staticmethod
     def extract_intent_and_entities(
         user_input: Text,
     ) -> Tuple[Optional[Text], float, List[Dict[Text, Any]]]:
         """Parse the user input using regexes to extract intent & entities."""
-
-        prefixes = re.escape(RegexInterpreter.allowed_prefixes())
-        # the regex matches "slot{"a": 1}"
-        m = re.search("^[" + prefixes + "]?([^{@]+)(@[0-9.]+)?([{].+)?", user_input)
+        m = RegexInterpreter._INTENT_AND_ENTITIES_PATTERN.search(user_input)
         if m is not None:
             event_name = m.group(1).strip()
             confidence = RegexInterpreter._parse_confidence(m.group(2))
@@ -1,4 +1,4 @@
-from collections import Callable
+from typing import Callable
 from pathlib import Path
 
 from _pytest.monkeypatch import MonkeyPatch
@@ -1,3 +1,4 @@
+import json
 from datetime import datetime
 from pathlib import Path
 
@@ -50,6 +51,12 @@ def test_metadata_serialization(domain: Domain, tmp_path: Path):
 
     serialized = metadata.as_dict()
 
+    # `to_json` is what actually ends up in the model archive and must stay
+    # in sync with the dict-based serialization
+    assert json.loads(metadata.to_json()) == json.loads(
+        json.dumps(serialized, ensure_ascii=False)
+    )
+
     # Dump and Load to make sure it's serializable
     dump_path = tmp_path / "metadata.json"
     rasa.shared.utils.io.dump_obj_as_json_to_file(dump_path, serialized)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 from typing import Dict, Text
 
@@ -46,6 +47,32 @@ def test_serialize_graph_schema(tmp_path: Path):
     assert graph_schema_from_file == graph_schema
 
 
+def test_to_json_round_trip():
+    graph_schema = GraphSchema(
+        {
+            "train": SchemaNode(
+                needs={},
+                uses=PersistableTestComponent,
+                fn="train",
+                constructor_name="create",
+                config={"some_config": 123455, "some more config": [{"nested": "hi"}]},
+            ),
+            "load": SchemaNode(
+                needs={"resource": "train"},
+                uses=PersistableTestComponent,
+                fn="run_inference",
+                constructor_name="load",
+                config={},
+                is_target=True,
+                resource=Resource("test resource"),
+            ),
+        }
+    )
+
+    assert json.loads(graph_schema.to_json()) == graph_schema.as_dict()
+    assert GraphSchema.from_dict(json.loads(graph_schema.to_json())) == graph_schema
+
+
 def test_invalid_module_error_when_deserializing_schemas(tmp_path: Path):
     graph_schema = GraphSchema(
         {
@@ -74,35 +101,66 @@ def test_invalid_module_error_when_deserializing_schemas(tmp_path: Path):
         _ = GraphSchema.from_dict(serialized_graph_schema_from_file)
 
 
+def _test_schema_node(needs: Dict[Text, Text], target: bool = False) -> SchemaNode:
+    return SchemaNode(
+        needs=needs, uses=None, fn="", constructor_name="", config={}, is_target=target,
+    )
+
+
 def test_minimal_graph_schema():
-    def test_schema_node(needs: Dict[Text, Text], target: bool = False) -> SchemaNode:
-        return SchemaNode(
-            needs=needs,
-            uses=None,
-            fn="",
-            constructor_name="",
-            config={},
-            is_target=target,
-        )
 
     assert GraphSchema(
         {
-            "1": test_schema_node({"i": "3"}, True),
-            "2": test_schema_node({"i": "3"}),
-            "3": test_schema_node({"i": "4"}),
-            "4": test_schema_node({}),
-            "5": test_schema_node({"i": "6"}),
-            "6": test_schema_node({}),
-            "7": test_schema_node({}),
-            "8": test_schema_node({"i": "9"}, True),
-            "9": test_schema_node({}),
+            "1": _test_schema_node({"i": "3"}, True),
+            "2": _test_schema_node({"i": "3"}),
+            "3": _test_schema_node({"i": "4"}),
+            "4": _test_schema_node({}),
+            "5": _test_schema_node({"i": "6"}),
+            "6": _test_schema_node({}),
+            "7": _test_schema_node({}),
+            "8": _test_schema_node({"i": "9"}, True),
+            "9": _test_schema_node({}),
         }
     ).minimal_graph_schema() == GraphSchema(
         {
-            "1": test_schema_node({"i": "3"}, True),
-            "3": test_schema_node({"i": "4"}),
-            "4": test_schema_node({}),
-            "8": test_schema_node({"i": "9"}, True),
-            "9": test_schema_node({}),
+            "1": _test_schema_node({"i": "3"}, True),
+            "3": _test_schema_node({"i": "4"}),
+            "4": _test_schema_node({}),
+            "8": _test_schema_node({"i": "9"}, True),
+            "9": _test_schema_node({}),
+        }
+    )
+
+
+def test_topological_order():
+    graph_schema = GraphSchema(
+        {
+            "1": _test_schema_node({"i": "3"}, True),
+            "2": _test_schema_node({"i": "3"}),
+            "3": _test_schema_node({"i": "4", "j": "6"}),
+            "4": _test_schema_node({}),
+            "5": _test_schema_node({"i": "6", "j": "1"}),
+            "6": _test_schema_node({}),
         }
     )
+
+    order = graph_schema.topological_order()
+
+    assert sorted(order) == sorted(graph_schema.nodes)
+    position = {node_name: index for index, node_name in enumerate(order)}
+    for node_name, node in graph_schema.nodes.items():
+        for parent_name in node.needs.values():
+            assert position[parent_name] < position[node_name]
+
+
+def test_topological_order_raises_on_cyclic_schema():
+    graph_schema = GraphSchema(
+        {
+            "1": _test_schema_node({"i": "2"}),
+            "2": _test_schema_node({"i": "3"}),
+            "3": _test_schema_node({"i": "1"}),
+        }
+    )
+
+    with pytest.raises(GraphSchemaException):
+        graph_schema.topological_order()
@@ -3,7 +3,10 @@ from typing import Text
 import pytest
 import copy
 
-from rasa.nlu.classifiers.keyword_intent_classifier import KeywordIntentClassifier
+from rasa.nlu.classifiers.keyword_intent_classifier import (
+    KeywordIntentClassifier,
+    MAX_KEYWORDS_FOR_SUBSTRING_SEARCH,
+)
 
 # TODO: add tests for other classifers
 # from rasa.nlu.classifiers.mitie_intent_classifier import MitieIntentClassifier
@@ -147,6 +150,54 @@ class TestKeywordClassifier(ClassifierTestCollection):
             in record[0].message.args[0]
         )
 
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "hi there goodbye",
+            "goodbye and hi there",
+            "good morning and good night",
+            "no keyword in here",
+            # punctuation-edged keywords follow the regex `\b` semantics:
+            # "goodbye!" only matches when a word character follows the "!"
+            "goodbye!",
+            "well goodbye!now",
+            "say !hi now",
+            "say!hi now",
+        ],
+    )
+    def test_substring_and_regex_search_agree(self, message):
+        intent_keyword_map = {
+            "hi": "greet",
+            "!hi": "greet_excited",
+            "good morning": "greet",
+            "goodbye": "bye",
+            "goodbye!": "bye_excited",
+            "good night": "bye",
+        }
+        substring_classifier = KeywordIntentClassifier(
+            {"case_sensitive": False}, dict(intent_keyword_map)
+        )
+        assert substring_classifier._use_substring_search
+
+        # enough unrelated keywords to push the classifier onto the regex path
+        padded_keyword_map = dict(intent_keyword_map)
+        padded_keyword_map.update(
+            {
+                f"unrelated keyword {i}": "other"
+                for i in range(MAX_KEYWORDS_FOR_SUBSTRING_SEARCH)
+            }
+        )
+        regex_classifier = KeywordIntentClassifier(
+            {"case_sensitive": False}, padded_keyword_map
+        )
+        assert not regex_classifier._use_substring_search
+
+        substring_message = Message(data={TEXT: message})
+        regex_message = Message(data={TEXT: message})
+        substring_classifier.process(substring_message)
+        regex_classifier.process(regex_message)
+        assert substring_message.get("intent") == regex_message.get("intent")
+
     @pytest.mark.filterwarnings("ignore:Keyword.* of keywords:UserWarning")
     def test_ambiguous_data(
         self, caplog, classifier_class, training_data, component_config, **kwargs
@@ -1,10 +1,60 @@
+from typing import Text
+
 import pytest
 
+import rasa.model
+import rasa.shared.nlu.training_data.loading
 from rasa.nlu.config import RasaNLUModelConfig
 from rasa.nlu.components import ComponentBuilder
+from rasa.nlu.model import Interpreter
+from rasa.shared.nlu.training_data.training_data import TrainingData
 from rasa.utils.tensorflow.constants import EPOCHS, RANDOM_SEED
 
 
+@pytest.fixture(scope="session")
+def demo_rasa_json_td() -> TrainingData:
+    """Loads the demo-rasa JSON training data once for the whole session.
+
+    Tests must not mutate the returned object; `TrainingData.merge` returns
+    a new instance, so merging is fine.
+    """
+    return rasa.shared.nlu.training_data.loading.load_data(
+        "data/examples/rasa/demo-rasa.json"
+    )
+
+
+@pytest.fixture(scope="session")
+def demo_rasa_yml_td() -> TrainingData:
+    """Loads the demo-rasa YAML training data once for the whole session."""
+    return rasa.shared.nlu.training_data.loading.load_data(
+        "data/examples/rasa/demo-rasa.yml"
+    )
+
+
+@pytest.fixture(scope="session")
+def demo_rasa_responses_yml_td() -> TrainingData:
+    """Loads the demo-rasa responses training data once for the session."""
+    return rasa.shared.nlu.training_data.loading.load_data(
+        "data/examples/rasa/demo-rasa-responses.yml"
+    )
+
+
+@pytest.fixture(scope="session")
+def loaded_rasa_nlu_interpreter(
+    unpacked_trained_rasa_model: Text, component_builder: ComponentBuilder
+) -> Interpreter:
+    """Loads the trained rasa model's NLU interpreter once for the session.
+
+    `Interpreter.load` deserializes model checkpoints and rebuilds the whole
+    pipeline, so tests should share the loaded instance instead of loading
+    their own copy.
+    """
+    _, nlu_model_directory = rasa.model.get_model_subdirectories(
+        unpacked_trained_rasa_model
+    )
+    return Interpreter.load(nlu_model_directory, component_builder)
+
+
 @pytest.fixture(scope="session")
 def spacy_nlp_component(component_builder, blank_config):
     spacy_nlp_config = {"name": "SpacyNLP", "model": "en_core_web_md"}
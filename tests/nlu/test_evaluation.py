@@ -1,5 +1,5 @@
 import datetime
-import json
+import functools
 import os
 import sys
 
@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Text, List, Dict, Any, Set, Optional
 from tests.conftest import AsyncMock
 
+import numpy as np
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
 from unittest.mock import Mock
@@ -77,7 +78,7 @@ from rasa.utils.tensorflow.constants import EPOCHS, ENTITY_RECOGNITION
 # https://github.com/pytest-dev/pytest-asyncio/issues/68
 # this event_loop is used by pytest-asyncio, and redefining it
 # is currently the only way of changing the scope of this fixture
-from tests.nlu.utilities import write_file_config
+from tests.nlu.utilities import write_file_configs
 
 
 # Chinese Example
@@ -158,6 +159,89 @@ EN_entity_result = EntityEvaluationResult(
 EN_entity_result_no_tokens = EntityEvaluationResult(EN_targets, EN_predicted, [], "")
 
 
+def _whitespace_tokens(text: Text) -> List[Token]:
+    """Tokenizes like the `WhitespaceTokenizer` without running a pipeline."""
+    tokens = []
+    offset = 0
+    for word in text.split():
+        start = text.index(word, offset)
+        tokens.append(Token(word, start))
+        offset = start + len(word)
+    return tokens
+
+
+def _canned_parse_result(text: Text) -> Dict[Text, Any]:
+    """A deterministic `Interpreter.parse` result for the CV tests.
+
+    The CV tests only assert on the shape of the metric containers, so real
+    DIETClassifier/ResponseSelector inference per message and fold would be
+    wasted work.
+    """
+    return {
+        "text": text,
+        "intent": {"name": "greet", "confidence": 0.9},
+        "intent_ranking": [{"name": "greet", "confidence": 0.9}],
+        "entities": [],
+        "text_tokens": _whitespace_tokens(text),
+        "response_selector": {
+            "default": {
+                "response": {
+                    "intent_response_key": "chitchat/ask_name",
+                    "confidence": 0.9,
+                }
+            }
+        },
+    }
+
+
+# Configs for the cross-validation tests. Training and parsing are mocked
+# there, so the pipelines can be built once per module and shared.
+CV_NLU_CONFIG = RasaNLUModelConfig(
+    {
+        "language": "en",
+        "pipeline": [
+            {"name": "WhitespaceTokenizer"},
+            {"name": "CountVectorsFeaturizer"},
+            {"name": "DIETClassifier", EPOCHS: 2},
+        ],
+    }
+)
+
+CV_RESPONSE_SELECTOR_NLU_CONFIG = RasaNLUModelConfig(
+    {
+        "language": "en",
+        "pipeline": [
+            {"name": "WhitespaceTokenizer"},
+            {"name": "CountVectorsFeaturizer"},
+            {"name": "DIETClassifier", EPOCHS: 2},
+            {"name": "ResponseSelector", EPOCHS: 2},
+        ],
+    }
+)
+
+
+_CV_CONFIGS = {
+    "default": CV_NLU_CONFIG,
+    "response_selector": CV_RESPONSE_SELECTOR_NLU_CONFIG,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _cv_pipeline_for(config_key: Text) -> List[Component]:
+    """Builds (once per config) the filtered pipeline the CV tests train on."""
+    return remove_pretrained_extractors(Trainer(_CV_CONFIGS[config_key]).pipeline)
+
+
+@pytest.fixture(scope="module")
+def cv_pipeline() -> List[Component]:
+    return _cv_pipeline_for("default")
+
+
+@pytest.fixture(scope="module")
+def cv_response_selector_pipeline() -> List[Component]:
+    return _cv_pipeline_for("response_selector")
+
+
 def test_token_entity_intersection():
     # included
     intsec = determine_intersection(CH_correct_segmentation[1], CH_correct_entity)
@@ -225,55 +309,43 @@ def test_determine_token_labels_with_extractors():
     assert label == "direction"
 
 
+# Shared parametrization inputs for `test_get_entity_confidences`; hoisted
+# to module scope so collection doesn't rebuild them.
+PIZZA_TOKEN = Token("pizza", 4)
+PIZZA_ENTITY_NO_CONFIDENCE = {
+    "start": 4,
+    "end": 9,
+    "value": "pizza",
+    "entity": "food",
+    "extractor": "EntityExtractorA",
+}
+PIZZA_ENTITY_CRF = {
+    "start": 4,
+    "end": 9,
+    "value": "pizza",
+    "entity": "food",
+    "confidence_entity": 0.87,
+    "extractor": "CRFEntityExtractor",
+}
+PIZZA_ENTITY_DIET = {
+    "start": 4,
+    "end": 9,
+    "value": "pizza",
+    "entity": "food",
+    "confidence_entity": 0.87,
+    "extractor": "DIETClassifier",
+}
+
+
 @pytest.mark.parametrize(
     "token, entities, extractors, expected_confidence",
     [
-        (
-            Token("pizza", 4),
-            [
-                {
-                    "start": 4,
-                    "end": 9,
-                    "value": "pizza",
-                    "entity": "food",
-                    "extractor": "EntityExtractorA",
-                }
-            ],
-            ["EntityExtractorA"],
-            0.0,
-        ),
-        (Token("pizza", 4), [], ["EntityExtractorA"], 0.0),
-        (
-            Token("pizza", 4),
-            [
-                {
-                    "start": 4,
-                    "end": 9,
-                    "value": "pizza",
-                    "entity": "food",
-                    "confidence_entity": 0.87,
-                    "extractor": "CRFEntityExtractor",
-                }
-            ],
-            ["CRFEntityExtractor"],
-            0.87,
-        ),
-        (
-            Token("pizza", 4),
-            [
-                {
-                    "start": 4,
-                    "end": 9,
-                    "value": "pizza",
-                    "entity": "food",
-                    "confidence_entity": 0.87,
-                    "extractor": "DIETClassifier",
-                }
-            ],
-            ["DIETClassifier"],
-            0.87,
-        ),
+        (PIZZA_TOKEN, [PIZZA_ENTITY_NO_CONFIDENCE], ["EntityExtractorA"], 0.0),
+        (PIZZA_TOKEN, [], ["EntityExtractorA"], 0.0),
+        (PIZZA_TOKEN, [PIZZA_ENTITY_CRF], ["CRFEntityExtractor"], 0.87),
+        (PIZZA_TOKEN, [PIZZA_ENTITY_DIET], ["DIETClassifier"], 0.87),
     ],
+    ids=["no_confidence", "no_entities", "crf", "diet"],
 )
 def test_get_entity_confidences(
     token: Token,
@@ -287,8 +359,6 @@ def test_get_entity_confidences(
 
 
 def test_label_merging():
-    import numpy as np
-
     aligned_predictions = [
         {
             "target_labels": ["O", "O"],
@@ -300,16 +370,16 @@ def test_label_merging():
         },
     ]
 
-    assert np.all(merge_labels(aligned_predictions) == ["O", "O", "LOC", "O", "O"])
-    assert np.all(
-        merge_labels(aligned_predictions, "EntityExtractorA")
-        == ["O", "O", "O", "O", "O"]
+    assert np.array_equal(
+        merge_labels(aligned_predictions), ["O", "O", "LOC", "O", "O"]
+    )
+    assert np.array_equal(
+        merge_labels(aligned_predictions, "EntityExtractorA"),
+        ["O", "O", "O", "O", "O"],
     )
 
 
 def test_confidence_merging():
-    import numpy as np
-
     aligned_predictions = [
         {
             "target_labels": ["O", "O"],
@@ -323,18 +393,17 @@ def test_confidence_merging():
         },
     ]
 
-    assert np.all(
-        merge_confidences(aligned_predictions, "EntityExtractorA")
-        == [0.0, 0.0, 0.98, 0.0, 0.0]
+    assert np.array_equal(
+        merge_confidences(aligned_predictions, "EntityExtractorA"),
+        [0.0, 0.0, 0.98, 0.0, 0.0],
     )
 
 
-def test_drop_intents_below_freq():
-    td = rasa.shared.nlu.training_data.loading.load_data(
-        "data/examples/rasa/demo-rasa.json"
-    )
+def test_drop_intents_below_freq(demo_rasa_json_td: TrainingData):
     # include some lookup tables and make sure new td has them
-    td = td.merge(TrainingData(lookup_tables=[{"lookup_table": "lookup_entry"}]))
+    td = demo_rasa_json_td.merge(
+        TrainingData(lookup_tables=[{"lookup_table": "lookup_entry"}])
+    )
     clean_td = drop_intents_below_freq(td, 0)
     assert clean_td.intents == {
         "affirm",
@@ -349,26 +418,34 @@ def test_drop_intents_below_freq():
     assert clean_td.lookup_tables == td.lookup_tables
 
 
+@pytest.mark.slow
 @pytest.mark.timeout(
     300, func_only=True
 )  # these can take a longer time than the default timeout
-def test_run_evaluation(unpacked_trained_moodbot_path: Text, nlu_as_json_path: Text):
+def test_run_evaluation(
+    unpacked_trained_moodbot_path: Text,
+    nlu_as_json_path: Text,
+    component_builder: ComponentBuilder,
+):
     result = run_evaluation(
         nlu_as_json_path,
         os.path.join(unpacked_trained_moodbot_path, "nlu"),
         errors=False,
         successes=False,
         disable_plotting=True,
+        # reuse the session-scoped builder so components of the loaded model
+        # are shared with other tests instead of being rebuilt here
+        component_builder=component_builder,
     )
 
     assert result.get("intent_evaluation")
 
 
+@pytest.mark.slow
 def test_eval_data(
-    component_builder: ComponentBuilder,
     tmp_path: Path,
     project: Text,
-    unpacked_trained_rasa_model: Text,
+    loaded_rasa_nlu_interpreter: Interpreter,
 ):
     config_path = os.path.join(project, "config.yml")
     data_importer = TrainingDataImporter.load_nlu_importer_from_config(
@@ -379,10 +456,7 @@ def test_eval_data(
         ],
     )
 
-    _, nlu_model_directory = rasa.model.get_model_subdirectories(
-        unpacked_trained_rasa_model
-    )
-    interpreter = Interpreter.load(nlu_model_directory, component_builder)
+    interpreter = loaded_rasa_nlu_interpreter
 
     data = data_importer.get_nlu_data()
     (intent_results, response_selection_results, entity_results) = get_eval_data(
@@ -394,32 +468,29 @@ def test_eval_data(
     assert len(entity_results) == 46
 
 
+@pytest.mark.slow
 @pytest.mark.timeout(
     240, func_only=True
 )  # these can take a longer time than the default timeout
 def test_run_cv_evaluation(
-    pretrained_embeddings_spacy_config: RasaNLUModelConfig, monkeypatch: MonkeyPatch
+    pretrained_embeddings_spacy_config: RasaNLUModelConfig,
+    monkeypatch: MonkeyPatch,
+    demo_rasa_json_td: TrainingData,
+    cv_pipeline: List[Component],
 ):
-    td = rasa.shared.nlu.training_data.loading.load_data(
-        "data/examples/rasa/demo-rasa.json"
-    )
+    td = demo_rasa_json_td
 
-    nlu_config = RasaNLUModelConfig(
-        {
-            "language": "en",
-            "pipeline": [
-                {"name": "WhitespaceTokenizer"},
-                {"name": "CountVectorsFeaturizer"},
-                {"name": "DIETClassifier", EPOCHS: 2},
-            ],
-        }
-    )
+    nlu_config = CV_NLU_CONFIG
 
-    # mock training
-    trainer = Trainer(nlu_config)
-    trainer.pipeline = remove_pretrained_extractors(trainer.pipeline)
-    mock = Mock(return_value=Interpreter(trainer.pipeline, None))
-    monkeypatch.setattr(Trainer, "train", mock)
+    # mock training and inference; a plain function avoids Mock's per-call
+    # bookkeeping, which adds up over folds x examples
+    interpreter = Interpreter(cv_pipeline, None)
+    monkeypatch.setattr(Trainer, "train", lambda self, *args, **kwargs: interpreter)
+    monkeypatch.setattr(
+        Interpreter,
+        "parse",
+        lambda self, text, *args, **kwargs: _canned_parse_result(text),
+    )
 
     n_folds = 2
     intent_results, entity_results, response_selection_results = cross_validate(
@@ -448,32 +519,26 @@ def test_run_cv_evaluation(
         assert all(key in extractor_evaluation for key in ["errors", "report"])
 
 
-def test_run_cv_evaluation_with_response_selector(monkeypatch: MonkeyPatch):
-    training_data_obj = rasa.shared.nlu.training_data.loading.load_data(
-        "data/examples/rasa/demo-rasa.yml"
-    )
-    training_data_responses_obj = rasa.shared.nlu.training_data.loading.load_data(
-        "data/examples/rasa/demo-rasa-responses.yml"
-    )
-    training_data_obj = training_data_obj.merge(training_data_responses_obj)
+@pytest.mark.slow
+def test_run_cv_evaluation_with_response_selector(
+    monkeypatch: MonkeyPatch,
+    demo_rasa_yml_td: TrainingData,
+    demo_rasa_responses_yml_td: TrainingData,
+    cv_response_selector_pipeline: List[Component],
+):
+    training_data_obj = demo_rasa_yml_td.merge(demo_rasa_responses_yml_td)
 
-    nlu_config = RasaNLUModelConfig(
-        {
-            "language": "en",
-            "pipeline": [
-                {"name": "WhitespaceTokenizer"},
-                {"name": "CountVectorsFeaturizer"},
-                {"name": "DIETClassifier", EPOCHS: 2},
-                {"name": "ResponseSelector", EPOCHS: 2},
-            ],
-        }
-    )
+    nlu_config = CV_RESPONSE_SELECTOR_NLU_CONFIG
 
-    # mock training
-    trainer = Trainer(nlu_config)
-    trainer.pipeline = remove_pretrained_extractors(trainer.pipeline)
-    mock = Mock(return_value=Interpreter(trainer.pipeline, None))
-    monkeypatch.setattr(Trainer, "train", mock)
+    # mock training and inference; a plain function avoids Mock's per-call
+    # bookkeeping, which adds up over folds x examples
+    interpreter = Interpreter(cv_response_selector_pipeline, None)
+    monkeypatch.setattr(Trainer, "train", lambda self, *args, **kwargs: interpreter)
+    monkeypatch.setattr(
+        Interpreter,
+        "parse",
+        lambda self, text, *args, **kwargs: _canned_parse_result(text),
+    )
 
     n_folds = 2
     intent_results, entity_results, response_selection_results = cross_validate(
@@ -536,6 +601,13 @@ def test_response_selector_present():
     assert not is_response_selector_present(interpreter_without_response_selector)
 
 
+# Shared by the intent report and plotting tests below.
+SAMPLE_INTENT_RESULTS = [
+    IntentEvaluationResult("", "restaurant_search", "I am hungry", 0.12345),
+    IntentEvaluationResult("greet", "greet", "hello", 0.98765),
+]
+
+
 def test_intent_evaluation_report(tmp_path: Path):
     path = tmp_path / "evaluation"
     path.mkdir()
@@ -544,20 +616,15 @@ def test_intent_evaluation_report(tmp_path: Path):
 
     rasa.shared.utils.io.create_directory(report_folder)
 
-    intent_results = [
-        IntentEvaluationResult("", "restaurant_search", "I am hungry", 0.12345),
-        IntentEvaluationResult("greet", "greet", "hello", 0.98765),
-    ]
-
     result = evaluate_intents(
-        intent_results,
+        SAMPLE_INTENT_RESULTS,
         report_folder,
         successes=True,
         errors=True,
-        disable_plotting=False,
+        disable_plotting=True,
     )
 
-    report = json.loads(rasa.shared.utils.io.read_file(report_filename))
+    report = rasa.shared.utils.io.read_json_file(report_filename)
 
     greet_results = {
         "precision": 1.0,
@@ -578,10 +645,27 @@ def test_intent_evaluation_report(tmp_path: Path):
     assert report["greet"] == greet_results
     assert result["predictions"][0] == prediction
 
-    assert os.path.exists(os.path.join(report_folder, "intent_confusion_matrix.png"))
-    assert os.path.exists(os.path.join(report_folder, "intent_histogram.png"))
-    assert not os.path.exists(os.path.join(report_folder, "intent_errors.json"))
-    assert os.path.exists(os.path.join(report_folder, "intent_successes.json"))
+    report_files = set(os.listdir(report_folder))
+    assert "intent_errors.json" not in report_files
+    assert "intent_successes.json" in report_files
+
+
+@pytest.mark.slow
+def test_intent_evaluation_plotting(tmp_path: Path):
+    report_folder = str(tmp_path / "reports")
+    rasa.shared.utils.io.create_directory(report_folder)
+
+    evaluate_intents(
+        SAMPLE_INTENT_RESULTS,
+        report_folder,
+        successes=False,
+        errors=False,
+        disable_plotting=False,
+    )
+
+    report_files = set(os.listdir(report_folder))
+    assert "intent_confusion_matrix.png" in report_files
+    assert "intent_histogram.png" in report_files
 
 
 def test_intent_evaluation_report_large(tmp_path: Path):
@@ -614,7 +698,7 @@ def test_intent_evaluation_report_large(tmp_path: Path):
         disable_plotting=True,
     )
 
-    report = json.loads(rasa.shared.utils.io.read_file(str(report_filename)))
+    report = rasa.shared.utils.io.read_json_file(report_filename)
 
     a_results = {
         "precision": 1.0,
@@ -640,6 +724,20 @@ def test_intent_evaluation_report_large(tmp_path: Path):
     assert report["C"]["confused_with"] == c_confused_with
 
 
+# Shared by the response selection report and plotting tests below.
+SAMPLE_RESPONSE_RESULTS = [
+    ResponseSelectionEvaluationResult(
+        "chitchat/ask_weather",
+        "chitchat/ask_weather",
+        "What's the weather",
+        0.65432,
+    ),
+    ResponseSelectionEvaluationResult(
+        "chitchat/ask_name", "chitchat/ask_name", "What's your name?", 0.98765
+    ),
+]
+
+
 def test_response_evaluation_report(tmp_path: Path):
     path = tmp_path / "evaluation"
     path.mkdir()
@@ -648,27 +746,15 @@ def test_response_evaluation_report(tmp_path: Path):
 
     rasa.shared.utils.io.create_directory(report_folder)
 
-    response_results = [
-        ResponseSelectionEvaluationResult(
-            "chitchat/ask_weather",
-            "chitchat/ask_weather",
-            "What's the weather",
-            0.65432,
-        ),
-        ResponseSelectionEvaluationResult(
-            "chitchat/ask_name", "chitchat/ask_name", "What's your name?", 0.98765
-        ),
-    ]
-
     result = evaluate_response_selections(
-        response_results,
+        SAMPLE_RESPONSE_RESULTS,
         report_folder,
         successes=True,
         errors=True,
-        disable_plotting=False,
+        disable_plotting=True,
     )
 
-    report = json.loads(rasa.shared.utils.io.read_file(report_filename))
+    report = rasa.shared.utils.io.read_json_file(report_filename)
 
     name_query_results = {
         "precision": 1.0,
@@ -689,19 +775,28 @@ def test_response_evaluation_report(tmp_path: Path):
     assert report["chitchat/ask_name"] == name_query_results
     assert result["predictions"][1] == prediction
 
-    assert os.path.exists(
-        os.path.join(report_folder, "response_selection_confusion_matrix.png")
-    )
-    assert os.path.exists(
-        os.path.join(report_folder, "response_selection_histogram.png")
-    )
-    assert not os.path.exists(
-        os.path.join(report_folder, "response_selection_errors.json")
-    )
-    assert os.path.exists(
-        os.path.join(report_folder, "response_selection_successes.json")
+    report_files = set(os.listdir(report_folder))
+    assert "response_selection_errors.json" not in report_files
+    assert "response_selection_successes.json" in report_files
+
+
+@pytest.mark.slow
+def test_response_evaluation_plotting(tmp_path: Path):
+    report_folder = str(tmp_path / "reports")
+    rasa.shared.utils.io.create_directory(report_folder)
+
+    evaluate_response_selections(
+        SAMPLE_RESPONSE_RESULTS,
+        report_folder,
+        successes=False,
+        errors=False,
+        disable_plotting=False,
     )
 
+    report_files = set(os.listdir(report_folder))
+    assert "response_selection_confusion_matrix.png" in report_files
+    assert "response_selection_histogram.png" in report_files
+
 
 @pytest.mark.parametrize(
     "components, expected_extractors",
@@ -715,6 +810,7 @@ def test_response_evaluation_report(tmp_path: Path):
         ),
         ([ResponseSelector()], set()),
     ],
+    ids=["diet_no_ner", "diet_ner", "crf", "spacy_and_crf", "response_selector"],
 )
 def test_get_entity_extractors(
     components: List[Component], expected_extractors: Set[Text]
@@ -725,23 +821,25 @@ def test_get_entity_extractors(
     assert extractors == expected_extractors
 
 
-def test_entity_evaluation_report(tmp_path: Path):
-    class EntityExtractorA(EntityExtractor):
+class EntityExtractorA(EntityExtractor):
 
-        provides = ["entities"]
+    provides = ["entities"]
 
-        def __init__(self, component_config=None) -> None:
+    def __init__(self, component_config=None) -> None:
 
-            super().__init__(component_config)
+        super().__init__(component_config)
 
-    class EntityExtractorB(EntityExtractor):
 
-        provides = ["entities"]
+class EntityExtractorB(EntityExtractor):
 
-        def __init__(self, component_config=None) -> None:
+    provides = ["entities"]
 
-            super().__init__(component_config)
+    def __init__(self, component_config=None) -> None:
 
+        super().__init__(component_config)
+
+
+def test_entity_evaluation_report(tmp_path: Path):
     path = tmp_path / "evaluation"
     path.mkdir()
     report_folder = str(path / "reports")
@@ -764,11 +862,11 @@ def test_entity_evaluation_report(tmp_path: Path):
         report_folder,
         errors=True,
         successes=True,
-        disable_plotting=False,
+        disable_plotting=True,
     )
 
-    report_a = json.loads(rasa.shared.utils.io.read_file(report_filename_a))
-    report_b = json.loads(rasa.shared.utils.io.read_file(report_filename_b))
+    report_a = rasa.shared.utils.io.read_json_file(report_filename_a)
+    report_b = rasa.shared.utils.io.read_json_file(report_filename_b)
 
     assert len(report_a) == 6
     assert report_a["datetime"]["support"] == 1.0
@@ -776,17 +874,29 @@ def test_entity_evaluation_report(tmp_path: Path):
     assert report_a["macro avg"]["recall"] == 0.5
     assert result["EntityExtractorA"]["accuracy"] == 0.75
 
-    assert os.path.exists(
-        os.path.join(report_folder, "EntityExtractorA_confusion_matrix.png")
-    )
-    assert os.path.exists(os.path.join(report_folder, "EntityExtractorA_errors.json"))
-    assert os.path.exists(
-        os.path.join(report_folder, "EntityExtractorA_successes.json")
-    )
-    assert not os.path.exists(
-        os.path.join(report_folder, "EntityExtractorA_histogram.png")
+    report_files = set(os.listdir(report_folder))
+    assert "EntityExtractorA_errors.json" in report_files
+    assert "EntityExtractorA_successes.json" in report_files
+
+
+@pytest.mark.slow
+def test_entity_evaluation_plotting(tmp_path: Path):
+    report_folder = str(tmp_path / "reports")
+    rasa.shared.utils.io.create_directory(report_folder)
+
+    evaluate_entities(
+        [EN_entity_result],
+        {"EntityExtractorA", "EntityExtractorB"},
+        report_folder,
+        errors=False,
+        successes=False,
+        disable_plotting=False,
     )
 
+    report_files = set(os.listdir(report_folder))
+    assert "EntityExtractorA_confusion_matrix.png" in report_files
+    assert "EntityExtractorA_histogram.png" not in report_files
+
 
 def test_empty_intent_removal():
     intent_results = [
@@ -833,85 +943,37 @@ def test_evaluate_entities_cv():
     mock_extractors = ["EntityExtractorA", "EntityExtractorB"]
     result = align_entity_predictions(EN_entity_result, mock_extractors)
 
-    assert result == {
-        "target_labels": [
-            "O",
-            "O",
-            "O",
-            "O",
-            "O",
-            "O",
-            "O",
-            "O",
-            "food",
-            "location",
-            "location",
-            "datetime",
-        ],
+    n_tokens = len(EN_tokens)
+
+    # all tokens are "O" except the ones covered by the target / predicted
+    # entities (see `EN_targets` and `EN_predicted` above)
+    target_labels = ["O"] * n_tokens
+    target_labels[8:] = ["food", "location", "location", "datetime"]
+
+    labels_a = ["O"] * n_tokens
+    labels_a[1] = "person"
+    labels_a[8] = "food"
+    labels_a[10] = "location"
+
+    labels_b = ["O"] * n_tokens
+    labels_b[10:] = ["movie", "movie"]
+
+    expected = {
+        "target_labels": target_labels,
         "extractor_labels": {
-            "EntityExtractorA": [
-                "O",
-                "person",
-                "O",
-                "O",
-                "O",
-                "O",
-                "O",
-                "O",
-                "food",
-                "O",
-                "location",
-                "O",
-            ],
-            "EntityExtractorB": [
-                "O",
-                "O",
-                "O",
-                "O",
-                "O",
-                "O",
-                "O",
-                "O",
-                "O",
-                "O",
-                "movie",
-                "movie",
-            ],
+            "EntityExtractorA": labels_a,
+            "EntityExtractorB": labels_b,
         },
         "confidences": {
-            "EntityExtractorA": [
-                0.0,
-                0.0,
-                0.0,
-                0.0,
-                0.0,
-                0.0,
-                0.0,
-                0.0,
-                0.0,
-                0.0,
-                0.0,
-                0.0,
-            ],
-            "EntityExtractorB": [
-                0.0,
-                0.0,
-                0.0,
-                0.0,
-                0.0,
-                0.0,
-                0.0,
-                0.0,
-                0.0,
-                0.0,
-                0.0,
-                0.0,
-            ],
+            "EntityExtractorA": [0.0] * n_tokens,
+            "EntityExtractorB": [0.0] * n_tokens,
         },
-    }, "Wrong entity prediction alignment"
+    }
+
+    assert result == expected, "Wrong entity prediction alignment"
 
 
-def test_remove_pretrained_extractors(component_builder: ComponentBuilder):
+def test_remove_pretrained_extractors():
     _config = RasaNLUModelConfig(
         {
             "pipeline": [
@@ -921,7 +983,17 @@ def test_remove_pretrained_extractors(component_builder: ComponentBuilder):
             ]
         }
     )
-    trainer = Trainer(_config, component_builder)
+    # `remove_pretrained_extractors` only looks at component names, so a
+    # builder producing name-only stubs avoids loading the spaCy model.
+    def _stub_component(config: Dict[Text, Any], cfg: RasaNLUModelConfig) -> Any:
+        stub_class = type(
+            config["name"], (), {"name": config["name"], "defaults": dict(config)}
+        )
+        return stub_class()
+
+    fake_builder = Mock()
+    fake_builder.create_component.side_effect = _stub_component
+    trainer = Trainer(_config, fake_builder, skip_validation=True)
 
     target_components_names = ["SpacyNLP"]
     filtered_pipeline = remove_pretrained_extractors(trainer.pipeline)
@@ -935,6 +1007,7 @@ def test_label_replacement():
     assert substitute_labels(original_labels, "O", "no_entity") == target_labels
 
 
+@pytest.mark.slow
 async def test_nlu_comparison(
     tmp_path: Path, monkeypatch: MonkeyPatch, nlu_as_json_path: Text
 ):
@@ -948,7 +1021,7 @@ async def test_nlu_comparison(
     }
     # the configs need to be at a different path, otherwise the results are
     # combined on the same dictionary key and cannot be plotted properly
-    configs = [write_file_config(config).name, write_file_config(config).name]
+    configs = [f.name for f in write_file_configs(config, count=2)]
 
     # mock training
     monkeypatch.setattr(Interpreter, "load", Mock(spec=RasaNLUInterpreter))
@@ -978,7 +1051,7 @@ async def test_nlu_comparison(
         configs, test_data, output, runs=2, exclusion_percentages=[50, 80]
     )
 
-    assert set(os.listdir(output)) == {
+    assert {entry.name for entry in os.scandir(output)} == {
         "run_1",
         "run_2",
         "results.json",
@@ -986,7 +1059,11 @@ async def test_nlu_comparison(
     }
 
     run_1_path = os.path.join(output, "run_1")
-    assert set(os.listdir(run_1_path)) == {"50%_exclusion", "80%_exclusion", "test.md"}
+    assert {entry.name for entry in os.scandir(run_1_path)} == {
+        "50%_exclusion",
+        "80%_exclusion",
+        "test.md",
+    }
 
     exclude_50_path = os.path.join(run_1_path, "50%_exclusion")
     modelnames = [os.path.splitext(os.path.basename(config))[0] for config in configs]
@@ -996,151 +1073,154 @@ async def test_nlu_comparison(
         + [f"{m}_report" for m in modelnames]
         + [f"{m}.tar.gz" for m in modelnames]
     )
-    assert set(os.listdir(exclude_50_path)) == modeloutputs
+    assert {entry.name for entry in os.scandir(exclude_50_path)} == modeloutputs
+
+
+_ENTITY_PREDICTION_CASES = [
+    (
+        [
+            EntityEvaluationResult(
+                entity_targets=[
+                    {
+                        "start": 17,
+                        "end": 24,
+                        "value": "Italian",
+                        "entity": "cuisine",
+                    }
+                ],
+                entity_predictions=[
+                    {
+                        "start": 17,
+                        "end": 24,
+                        "value": "Italian",
+                        "entity": "cuisine",
+                    }
+                ],
+                tokens=[
+                    "I",
+                    "want",
+                    "to",
+                    "book",
+                    "an",
+                    "Italian",
+                    "restaurant",
+                    ".",
+                ],
+                message="I want to book an Italian restaurant.",
+            ),
+            EntityEvaluationResult(
+                entity_targets=[
+                    {
+                        "start": 8,
+                        "end": 15,
+                        "value": "Mexican",
+                        "entity": "cuisine",
+                    },
+                    {
+                        "start": 31,
+                        "end": 32,
+                        "value": "4",
+                        "entity": "number_people",
+                    },
+                ],
+                entity_predictions=[],
+                tokens=[
+                    "Book",
+                    "an",
+                    "Mexican",
+                    "restaurant",
+                    "for",
+                    "4",
+                    "people",
+                    ".",
+                ],
+                message="Book an Mexican restaurant for 4 people.",
+            ),
+        ],
+        [
+            NO_ENTITY,
+            NO_ENTITY,
+            NO_ENTITY,
+            NO_ENTITY,
+            NO_ENTITY,
+            "cuisine",
+            NO_ENTITY,
+            NO_ENTITY,
+            NO_ENTITY,
+            NO_ENTITY,
+            "cuisine",
+            NO_ENTITY,
+            NO_ENTITY,
+            "number_people",
+            NO_ENTITY,
+            NO_ENTITY,
+        ],
+        [
+            NO_ENTITY,
+            NO_ENTITY,
+            NO_ENTITY,
+            NO_ENTITY,
+            NO_ENTITY,
+            "cuisine",
+            NO_ENTITY,
+            NO_ENTITY,
+            NO_ENTITY,
+            NO_ENTITY,
+            NO_ENTITY,
+            NO_ENTITY,
+            NO_ENTITY,
+            NO_ENTITY,
+            NO_ENTITY,
+            NO_ENTITY,
+        ],
+        [
+            {
+                "text": "I want to book an Italian restaurant.",
+                "entities": [
+                    {
+                        "start": 17,
+                        "end": 24,
+                        "value": "Italian",
+                        "entity": "cuisine",
+                    }
+                ],
+                "predicted_entities": [
+                    {
+                        "start": 17,
+                        "end": 24,
+                        "value": "Italian",
+                        "entity": "cuisine",
+                    }
+                ],
+            }
+        ],
+        [
+            {
+                "text": "Book an Mexican restaurant for 4 people.",
+                "entities": [
+                    {
+                        "start": 8,
+                        "end": 15,
+                        "value": "Mexican",
+                        "entity": "cuisine",
+                    },
+                    {
+                        "start": 31,
+                        "end": 32,
+                        "value": "4",
+                        "entity": "number_people",
+                    },
+                ],
+                "predicted_entities": [],
+            }
+        ],
+    )
+]
 
 
 @pytest.mark.parametrize(
     "entity_results,targets,predictions,successes,errors",
-    [
-        (
-            [
-                EntityEvaluationResult(
-                    entity_targets=[
-                        {
-                            "start": 17,
-                            "end": 24,
-                            "value": "Italian",
-                            "entity": "cuisine",
-                        }
-                    ],
-                    entity_predictions=[
-                        {
-                            "start": 17,
-                            "end": 24,
-                            "value": "Italian",
-                            "entity": "cuisine",
-                        }
-                    ],
-                    tokens=[
-                        "I",
-                        "want",
-                        "to",
-                        "book",
-                        "an",
-                        "Italian",
-                        "restaurant",
-                        ".",
-                    ],
-                    message="I want to book an Italian restaurant.",
-                ),
-                EntityEvaluationResult(
-                    entity_targets=[
-                        {
-                            "start": 8,
-                            "end": 15,
-                            "value": "Mexican",
-                            "entity": "cuisine",
-                        },
-                        {
-                            "start": 31,
-                            "end": 32,
-                            "value": "4",
-                            "entity": "number_people",
-                        },
-                    ],
-                    entity_predictions=[],
-                    tokens=[
-                        "Book",
-                        "an",
-                        "Mexican",
-                        "restaurant",
-                        "for",
-                        "4",
-                        "people",
-                        ".",
-                    ],
-                    message="Book an Mexican restaurant for 4 people.",
-                ),
-            ],
-            [
-                NO_ENTITY,
-                NO_ENTITY,
-                NO_ENTITY,
-                NO_ENTITY,
-                NO_ENTITY,
-                "cuisine",
-                NO_ENTITY,
-                NO_ENTITY,
-                NO_ENTITY,
-                NO_ENTITY,
-                "cuisine",
-                NO_ENTITY,
-                NO_ENTITY,
-                "number_people",
-                NO_ENTITY,
-                NO_ENTITY,
-            ],
-            [
-                NO_ENTITY,
-                NO_ENTITY,
-                NO_ENTITY,
-                NO_ENTITY,
-                NO_ENTITY,
-                "cuisine",
-                NO_ENTITY,
-                NO_ENTITY,
-                NO_ENTITY,
-                NO_ENTITY,
-                NO_ENTITY,
-                NO_ENTITY,
-                NO_ENTITY,
-                NO_ENTITY,
-                NO_ENTITY,
-                NO_ENTITY,
-            ],
-            [
-                {
-                    "text": "I want to book an Italian restaurant.",
-                    "entities": [
-                        {
-                            "start": 17,
-                            "end": 24,
-                            "value": "Italian",
-                            "entity": "cuisine",
-                        }
-                    ],
-                    "predicted_entities": [
-                        {
-                            "start": 17,
-                            "end": 24,
-                            "value": "Italian",
-                            "entity": "cuisine",
-                        }
-                    ],
-                }
-            ],
-            [
-                {
-                    "text": "Book an Mexican restaurant for 4 people.",
-                    "entities": [
-                        {
-                            "start": 8,
-                            "end": 15,
-                            "value": "Mexican",
-                            "entity": "cuisine",
-                        },
-                        {
-                            "start": 31,
-                            "end": 32,
-                            "value": "4",
-                            "entity": "number_people",
-                        },
-                    ],
-                    "predicted_entities": [],
-                }
-            ],
-        )
-    ],
+    _ENTITY_PREDICTION_CASES,
 )
 def test_collect_entity_predictions(
     entity_results: List[EntityEvaluationResult],
@@ -1174,6 +1254,11 @@ class ConstantInterpreter(Interpreter):
     ) -> Dict[Text, Any]:
         return self.prediction
 
+    def parse_batch(
+        self, texts: List[Text], only_output_properties: bool = True
+    ) -> List[Dict[Text, Any]]:
+        return [self.prediction] * len(texts)
+
 
 def test_replacing_fallback_intent():
     expected_intent = "greet"
@@ -3,12 +3,24 @@ import ruamel.yaml as yaml
 
 
 def write_file_config(file_config):
-    with tempfile.NamedTemporaryFile(
-        "w+", suffix="_tmp_config_file.yml", delete=False
-    ) as f:
-        f.write(yaml.safe_dump(file_config))
-        f.flush()
-        return f
+    return write_file_configs(file_config, count=1)[0]
+
+
+def write_file_configs(file_config, count):
+    """Writes the same config to `count` distinct temporary files.
+
+    The YAML payload is serialized once and reused for every file.
+    """
+    content = yaml.safe_dump(file_config)
+    files = []
+    for _ in range(count):
+        with tempfile.NamedTemporaryFile(
+            "w+", suffix="_tmp_config_file.yml", delete=False
+        ) as f:
+            f.write(content)
+            f.flush()
+            files.append(f)
+    return files
 
 
 class ResponseTest:
@@ -0,0 +1,97 @@
+"""Fixtures caching expensive story parsing and featurization.
+
+All inputs are read-only story files, so the tests in this package can be
+distributed freely by pytest-xdist (`make test` runs with `-n`). The caches
+below live in session-scoped fixtures and are therefore per worker process;
+each worker parses a story file at most once.
+"""
+import copy
+from typing import Any, Callable, Dict, List, Text, Tuple
+
+import pytest
+
+from rasa.core import training
+from rasa.core.featurizers.single_state_featurizer import SingleStateFeaturizer
+from rasa.core.featurizers.tracker_featurizers import MaxHistoryTrackerFeaturizer
+from rasa.shared.core.domain import Domain
+from rasa.shared.core.generator import TrackerWithCachedStates
+from rasa.shared.nlu.interpreter import RegexInterpreter
+
+
+@pytest.fixture(scope="session")
+def domain(_domain: Domain) -> Domain:
+    """Overrides the function-scoped `domain` fixture with a shared instance.
+
+    The story-reader tests only read domain attributes, so the per-test
+    deep copy the global fixture makes is unnecessary here.
+    """
+    return _domain
+
+
+@pytest.fixture(scope="session")
+def load_data_cached() -> Callable[..., List[TrackerWithCachedStates]]:
+    """Caches `training.load_data` results across the story-reader tests.
+
+    Several tests load the same story files with the same arguments, and
+    parsing plus tracker generation dominate their runtime. Results are
+    cached per resource, domain fingerprint and keyword arguments; every
+    hit returns a deep copy so a test mutating its trackers cannot poison
+    the cache.
+    """
+    cache: Dict[Tuple, List[TrackerWithCachedStates]] = {}
+
+    def _load(
+        resource: Text, domain: Domain, **kwargs: Any
+    ) -> List[TrackerWithCachedStates]:
+        key = (resource, domain.fingerprint(), tuple(sorted(kwargs.items())))
+        if key not in cache:
+            cache[key] = training.load_data(resource, domain, **kwargs)
+        trackers = copy.deepcopy(cache[key])
+        # trackers compare their domain by identity, so the copies need to
+        # be re-attached to the domain instance the current test uses
+        for tracker in trackers:
+            tracker.domain = domain
+        return trackers
+
+    return _load
+
+
+@pytest.fixture(scope="session")
+def featurize_trackers_cached(load_data_cached: Callable) -> Callable[..., Tuple]:
+    """Caches `MaxHistoryTrackerFeaturizer.featurize_trackers` results.
+
+    Featurization with the `RegexInterpreter` is the slowest step of the
+    story-reader tests that need model data. Trackers are sorted by sender
+    id before featurizing so the cached example order is deterministic.
+    """
+    cache: Dict[Tuple, Tuple] = {}
+
+    def _featurize(
+        resource: Text, domain: Domain, max_history: int, **load_kwargs: Any
+    ) -> Tuple:
+        key = (
+            resource,
+            domain.fingerprint(),
+            max_history,
+            tuple(sorted(load_kwargs.items())),
+        )
+        if key not in cache:
+            trackers = sorted(
+                load_data_cached(resource, domain, **load_kwargs),
+                key=lambda t: t.sender_id,
+            )
+            featurizer = MaxHistoryTrackerFeaturizer(
+                SingleStateFeaturizer(), max_history=max_history
+            )
+            cache[key] = (
+                trackers,
+                featurizer.featurize_trackers(
+                    trackers, domain, interpreter=RegexInterpreter()
+                ),
+            )
+        trackers, (data, label_ids, entity_tags) = cache[key]
+        for tracker in trackers:
+            tracker.domain = domain
+        return trackers, data, label_ids, entity_tags
+
+    return _featurize